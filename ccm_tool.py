@@ -2,40 +2,61 @@
 Main command-line interface for the Smartcard Management Tool.
 """
 
+import itertools
 import logging
 import os
+import re
 import sys
+from functools import cached_property, lru_cache
+from operator import attrgetter
 import click
-from typing import Optional, List
+from typing import Optional, List, TYPE_CHECKING
 import colorama
 from colorama import Fore, Back, Style
-from tabulate import tabulate
-from smartcard.util import toHexString
 
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.smartcard_manager import SmartcardManager, SmartcardException
-from src.globalplatform import GlobalPlatformManager, SecurityDomainInfo, ApplicationInfo
-from src.secure_channel import SecureChannelManager, KeySet
-from src.config_manager import ConfigManager
-from src.visualization import SecurityDomainVisualizer
-from src.database_manager import DatabaseManager, KeysetRecord
-from src.ota_manager import OTAManager
-
-# Initialize colorama for cross-platform color support
-colorama.init()
+# Heavy modules (pyscard, matplotlib, tabulate, the src.* managers) are
+# imported inside the commands that need them to keep CLI startup fast.
+if TYPE_CHECKING:
+    from src.smartcard_manager import SmartcardManager
+    from src.globalplatform import GlobalPlatformManager
+    from src.secure_channel import SecureChannelManager
+    from src.config_manager import ConfigManager
+    from src.visualization import SecurityDomainVisualizer
+    from src.database_manager import DatabaseManager
+    from src.globalplatform import SecurityDomainInfo, ApplicationInfo
 
 # Setup logging
-def setup_logging(config_manager: ConfigManager):
-    """Setup logging configuration"""
+_LOGGING_CONFIGURED = False
+
+
+def setup_logging(config_manager: 'ConfigManager'):
+    """Setup logging configuration (once per process)"""
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
+    _LOGGING_CONFIGURED = True
+    
     log_config = config_manager.logging_config
     if log_config:
         # Create logs directory if it doesn't exist
         log_dir = os.path.dirname(log_config.file)
-        if log_dir:
+        if log_dir and not os.path.isdir(log_dir):
             os.makedirs(log_dir, exist_ok=True)
         
+        root = logging.getLogger()
+        if root.handlers:
+            # Logging was configured by the host (e.g. a test harness);
+            # only attach our log file if it isn't there already
+            log_file = os.path.abspath(log_config.file)
+            if not any(getattr(h, 'baseFilename', None) == log_file for h in root.handlers):
+                file_handler = logging.FileHandler(log_file)
+                file_handler.setFormatter(logging.Formatter(log_config.format))
+                root.addHandler(file_handler)
+            return
+        
         logging.basicConfig(
             level=getattr(logging, log_config.level.upper()),
             format=log_config.format,
@@ -49,58 +70,201 @@ def setup_logging(config_manager: ConfigManager):
 
 logger = logging.getLogger(__name__)
 
+# Message prefixes are built once; colors are skipped when output is piped
+if sys.stdout.isatty():
+    _OK = f"{Fore.GREEN}✓ "
+    _ERR = f"{Fore.RED}✗ "
+    _WARN = f"{Fore.YELLOW}⚠ "
+    _INFO = f"{Fore.BLUE}ℹ "
+    _RST = Style.RESET_ALL
+else:
+    _OK, _ERR, _WARN, _INFO, _RST = "✓ ", "✗ ", "⚠ ", "ℹ ", ""
+
+# Interned option values shared by the click choices below
+_PROTOCOLS = tuple(sys.intern(p) for p in ('SCP02', 'SCP03'))
+_DOMAIN_TYPES = tuple(sys.intern(t) for t in ('SSD', 'AMSD', 'DMSD'))
+_CLFDB_OPERATIONS = tuple(sys.intern(o) for o in ('lock', 'unlock', 'terminate'))
+_OTA_OPERATIONS = tuple(sys.intern(o) for o in ('LOCK', 'UNLOCK', 'TERMINATE', 'MAKE_SELECTABLE'))
+
+# Privileges and life cycle values are single bytes, tabulated as "0xNN" once
+_BYTE_HEX = tuple(f"0x{i:02X}" for i in range(256))
+
+# 16- or 24-byte key given as hex (32 or 48 characters)
+_HEX_KEY_RE = re.compile(r'[0-9a-fA-F]{32}(?:[0-9a-fA-F]{16})?')
+
+
+# Fixed column widths for 'ota list', so every streamed chunk lines up
+_OTA_LIST_COLUMNS = (('ID', 6), ('Target AID', 32), ('Operation', 15),
+                     ('Status', 9), ('Created', 19), ('SMS TPDU', 23))
+
+
+def _ota_list_line(values) -> str:
+    """Lay out one 'ota list' line in the fixed column widths"""
+    return "  ".join(str(value)[:width].ljust(width)
+                     for value, (_, width) in zip(values, _OTA_LIST_COLUMNS)).rstrip()
+
+
+def _trunc(text: str, width: int = 40) -> str:
+    """Truncate text to width characters, ending with an ellipsis if cut"""
+    return text if len(text) <= width else text[:width - 3] + "..."
+
+
+@lru_cache(maxsize=256)
+def _aid_hex(aid: bytes) -> str:
+    """Format AID bytes as spaced upper-case hex (same output as toHexString)"""
+    return bytes(aid).hex(' ').upper()
+
+
+@lru_cache(maxsize=256)
+def _parse_aid(aid: str) -> bytes:
+    """Parse a hex AID string (cached, AIDs repeat across scripted runs)"""
+    return bytes.fromhex(aid)
+
+
+@lru_cache(maxsize=256)
+def _validate_aid(aid: str) -> bool:
+    """Check that an AID is 5-16 bytes of hex"""
+    try:
+        return 5 <= len(_parse_aid(aid)) <= 16
+    except ValueError:
+        return False
+
 
 class SmartcardCLI:
     """Command-line interface for smartcard management"""
     
-    def __init__(self):
-        self.config_manager = ConfigManager()
-        setup_logging(self.config_manager)
-        
-        self.sc_manager = SmartcardManager()
-        self.gp_manager = GlobalPlatformManager(self.sc_manager)
-        self.secure_channel = SecureChannelManager(self.sc_manager)
-        self.visualizer = SecurityDomainVisualizer(
-            self.config_manager.get_visualization_output_dir()
-        )
+    _BANNER_TOP = "╔" + "═" * 60 + "╗"
+    _BANNER_BOTTOM = "╚" + "═" * 60 + "╝"
+    
+    def __init__(self, quiet: bool = False):
+        self.quiet = quiet
         
+        # Managers are built on first access so each subcommand only pays
+        # for the subsystems it actually uses.
         self.connected_reader: Optional[str] = None
         self.secure_channel_active = False
+        
+        # Card contents cached for the session to avoid repeated GET STATUS
+        self._domains_cache: Optional[List['SecurityDomainInfo']] = None
+        self._apps_cache: Optional[List['ApplicationInfo']] = None
+        self._cm_selected = False
+    
+    @cached_property
+    def config_manager(self) -> 'ConfigManager':
+        """Configuration manager (also initializes logging)"""
+        from src.config_manager import ConfigManager
+        config_manager = ConfigManager()
+        setup_logging(config_manager)
+        return config_manager
+    
+    @cached_property
+    def sc_manager(self) -> 'SmartcardManager':
+        """PC/SC smartcard manager"""
+        from src.smartcard_manager import SmartcardManager
+        return SmartcardManager()
+    
+    @cached_property
+    def gp_manager(self) -> 'GlobalPlatformManager':
+        """GlobalPlatform manager bound to the smartcard manager"""
+        from src.globalplatform import GlobalPlatformManager
+        return GlobalPlatformManager(self.sc_manager)
+    
+    @cached_property
+    def secure_channel(self) -> 'SecureChannelManager':
+        """Secure channel manager bound to the smartcard manager"""
+        from src.secure_channel import SecureChannelManager
+        return SecureChannelManager(self.sc_manager)
+    
+    @cached_property
+    def db_manager(self) -> 'DatabaseManager':
+        """Keyset/OTA database, shared with the configuration manager"""
+        return self.config_manager.db_manager
+    
+    @cached_property
+    def visualizer(self) -> 'SecurityDomainVisualizer':
+        """Security domain visualizer"""
+        from src.visualization import SecurityDomainVisualizer
+        return SecurityDomainVisualizer(
+            self.config_manager.get_visualization_output_dir()
+        )
+    
+    def ensure_card_manager(self) -> bool:
+        """Select the Card Manager once per connection, on first GP use"""
+        if not self._cm_selected:
+            self._cm_selected = self.gp_manager.select_card_manager()
+        return self._cm_selected
+    
+    def get_security_domains(self) -> List['SecurityDomainInfo']:
+        """List security domains, reusing the cached result for this session"""
+        if self._domains_cache is None:
+            self.ensure_card_manager()
+            self._domains_cache = self.gp_manager.list_security_domains()
+        return self._domains_cache
+    
+    def get_applications(self) -> List['ApplicationInfo']:
+        """List applications, reusing the cached result for this session"""
+        if self._apps_cache is None:
+            self.ensure_card_manager()
+            self._apps_cache = self.gp_manager.list_applications()
+        return self._apps_cache
+    
+    def invalidate_card_cache(self):
+        """Drop cached card contents after a state-changing operation"""
+        self._domains_cache = None
+        self._apps_cache = None
     
     def print_banner(self):
         """Print application banner"""
+        if self.quiet or not sys.stdout.isatty():
+            return
+        
+        if self._banner:
+            print(self._banner)
+    
+    @cached_property
+    def _banner(self) -> str:
+        """Banner text, built once per process from the app config"""
         app_config = self.config_manager.app_config
-        if app_config:
-            print(f"{Fore.CYAN}{Style.BRIGHT}")
-            print("╔" + "═" * 60 + "╗")
-            print(f"║{app_config.name:^60}║")
-            print(f"║{f'Version {app_config.version}':^60}║")
-            print("╚" + "═" * 60 + "╝")
-            print(f"{Style.RESET_ALL}")
+        if not app_config:
+            return ""
+        
+        version = f"Version {app_config.version}"
+        return (
+            f"{Fore.CYAN}{Style.BRIGHT}\n"
+            f"{self._BANNER_TOP}\n"
+            f"║{app_config.name:^60}║\n"
+            f"║{version:^60}║\n"
+            f"{self._BANNER_BOTTOM}\n"
+            f"{Style.RESET_ALL}"
+        )
     
     def print_success(self, message: str):
         """Print success message"""
-        print(f"{Fore.GREEN}✓ {message}{Style.RESET_ALL}")
+        print(_OK, message, _RST, sep='')
     
     def print_error(self, message: str):
         """Print error message"""
-        print(f"{Fore.RED}✗ {message}{Style.RESET_ALL}")
+        print(_ERR, message, _RST, sep='')
     
     def print_warning(self, message: str):
         """Print warning message"""
-        print(f"{Fore.YELLOW}⚠ {message}{Style.RESET_ALL}")
+        print(_WARN, message, _RST, sep='')
     
     def print_info(self, message: str):
         """Print info message"""
-        print(f"{Fore.BLUE}ℹ {message}{Style.RESET_ALL}")
+        print(_INFO, message, _RST, sep='')
 
 
 @click.group()
+@click.option('--quiet', '-q', is_flag=True, help='Suppress the startup banner')
 @click.pass_context
-def cli(ctx):
+def cli(ctx, quiet: bool):
     """Smartcard Management Tool - Comprehensive PC/SC and GlobalPlatform interface"""
+    # Initialize colorama for cross-platform color support
+    colorama.init()
+    
     ctx.ensure_object(dict)
-    ctx.obj['cli'] = SmartcardCLI()
+    ctx.obj['cli'] = SmartcardCLI(quiet=quiet)
     ctx.obj['cli'].print_banner()
 
 
@@ -114,8 +278,7 @@ def list_readers(ctx):
         readers = cli_obj.sc_manager.list_readers()
         if readers:
             cli_obj.print_success(f"Found {len(readers)} reader(s):")
-            for i, reader in enumerate(readers, 1):
-                print(f"  {i}. {reader}")
+            print('\n'.join(f"  {i}. {reader}" for i, reader in enumerate(readers, 1)))
         else:
             cli_obj.print_warning("No PC/SC readers found")
     except Exception as e:
@@ -125,21 +288,25 @@ def list_readers(ctx):
 @cli.command()
 @click.argument('reader_name')
 @click.option('--timeout', default=5000, help='Connection timeout in milliseconds')
+@click.option('--select-cm/--no-select-cm', default=False,
+              help='Select the Card Manager right after connecting')
 @click.pass_context
-def connect(ctx, reader_name: str, timeout: int):
+def connect(ctx, reader_name: str, timeout: int, select_cm: bool):
     """Connect to a smartcard reader"""
     cli_obj = ctx.obj['cli']
     
     try:
         if cli_obj.sc_manager.connect_to_reader(reader_name, timeout):
             cli_obj.connected_reader = reader_name
+            cli_obj._cm_selected = False
             cli_obj.print_success(f"Connected to reader: {reader_name}")
             
-            # Try to select Card Manager
-            if cli_obj.gp_manager.select_card_manager():
-                cli_obj.print_success("Card Manager selected")
-            else:
-                cli_obj.print_warning("Could not select Card Manager")
+            # Otherwise the Card Manager is selected lazily by the first GP command
+            if select_cm:
+                if cli_obj.ensure_card_manager():
+                    cli_obj.print_success("Card Manager selected")
+                else:
+                    cli_obj.print_warning("Could not select Card Manager")
         else:
             cli_obj.print_error(f"Failed to connect to reader: {reader_name}")
     except Exception as e:
@@ -159,35 +326,34 @@ def disconnect(ctx):
         
         cli_obj.sc_manager.disconnect_all()
         cli_obj.connected_reader = None
+        cli_obj._cm_selected = False
+        cli_obj.invalidate_card_cache()
         cli_obj.print_success("Disconnected from all readers")
     except Exception as e:
         cli_obj.print_error(f"Disconnect error: {e}")
 
 
-@cli.command()
+@cli.command('list-keysets')
 @click.pass_context
-def list_keysets(ctx):
+def list_keysets_cfg(ctx):
     """List all configured keysets"""
+    from tabulate import tabulate
+    
     cli_obj = ctx.obj['cli']
     
     keysets = cli_obj.config_manager.list_keysets()
     if keysets:
         cli_obj.print_success(f"Found {len(keysets)} keyset(s):")
         
-        table_data = []
-        for name in keysets:
-            keyset = cli_obj.config_manager.get_keyset(name)
-            if keyset:
-                table_data.append([
-                    name,
-                    keyset.protocol,
-                    keyset.key_version,
-                    keyset.enc_key.hex()[:16] + "..."
-                ])
+        configured = ((name, cli_obj.config_manager.get_keyset(name)) for name in keysets)
+        table_data = [
+            [name, keyset.protocol, keyset.key_version, keyset.enc_key.hex()[:16] + "..."]
+            for name, keyset in configured if keyset
+        ]
         
         print(tabulate(table_data, 
                       headers=['Name', 'Protocol', 'Version', 'ENC Key (partial)'],
-                      tablefmt='grid'))
+                      tablefmt='simple'))
     else:
         cli_obj.print_warning("No keysets configured")
 
@@ -212,8 +378,12 @@ def establish_secure_channel(ctx, keyset_name: str, security_level: int):
     try:
         cli_obj.print_info(f"Establishing {keyset.protocol} secure channel...")
         
+        if not cli_obj.ensure_card_manager():
+            cli_obj.print_warning("Could not select Card Manager")
+        
         if cli_obj.secure_channel.establish_secure_channel(keyset, security_level):
             cli_obj.secure_channel_active = True
+            cli_obj.invalidate_card_cache()
             cli_obj.print_success(f"Secure channel established ({keyset.protocol}, SL={security_level})")
         else:
             cli_obj.print_error("Failed to establish secure channel")
@@ -239,6 +409,8 @@ def close_secure_channel(ctx):
 @click.pass_context
 def list_applications(ctx):
     """List all applications on the card"""
+    from tabulate import tabulate
+    
     cli_obj = ctx.obj['cli']
     
     if not cli_obj.connected_reader:
@@ -246,23 +418,25 @@ def list_applications(ctx):
         return
     
     try:
-        applications = cli_obj.gp_manager.list_applications()
+        with cli_obj.sc_manager.transaction():
+            applications = cli_obj.get_applications()
         
         if applications:
             cli_obj.print_success(f"Found {len(applications)} application(s):")
             
-            table_data = []
-            for app in applications:
-                table_data.append([
-                    toHexString(app.aid),
+            table_data = [
+                [
+                    _aid_hex(app.aid),
                     app.life_cycle.name,
-                    f"0x{app.privileges:02X}",
-                    f"0x{app.life_cycle.value:02X}"
-                ])
+                    _BYTE_HEX[app.privileges],
+                    _BYTE_HEX[app.life_cycle.value]
+                ]
+                for app in applications
+            ]
             
             print(tabulate(table_data,
                           headers=['AID', 'Lifecycle', 'Privileges', 'LC Value'],
-                          tablefmt='grid'))
+                          tablefmt='simple'))
         else:
             cli_obj.print_warning("No applications found")
             
@@ -274,6 +448,8 @@ def list_applications(ctx):
 @click.pass_context
 def list_security_domains(ctx):
     """List all security domains on the card"""
+    from tabulate import tabulate
+    
     cli_obj = ctx.obj['cli']
     
     if not cli_obj.connected_reader:
@@ -281,24 +457,26 @@ def list_security_domains(ctx):
         return
     
     try:
-        domains = cli_obj.gp_manager.list_security_domains()
+        with cli_obj.sc_manager.transaction():
+            domains = cli_obj.get_security_domains()
         
         if domains:
             cli_obj.print_success(f"Found {len(domains)} security domain(s):")
             
-            table_data = []
-            for domain in domains:
-                table_data.append([
-                    toHexString(domain.aid),
+            table_data = [
+                [
+                    _aid_hex(domain.aid),
                     domain.domain_type,
                     domain.life_cycle.name,
-                    f"0x{domain.privileges:02X}",
-                    f"0x{domain.life_cycle.value:02X}"
-                ])
+                    _BYTE_HEX[domain.privileges],
+                    _BYTE_HEX[domain.life_cycle.value]
+                ]
+                for domain in domains
+            ]
             
             print(tabulate(table_data,
                           headers=['AID', 'Type', 'Lifecycle', 'Privileges', 'LC Value'],
-                          tablefmt='grid'))
+                          tablefmt='simple'))
         else:
             cli_obj.print_warning("No security domains found")
             
@@ -308,7 +486,7 @@ def list_security_domains(ctx):
 
 @cli.command()
 @click.argument('aid', type=str)
-@click.option('--domain-type', type=click.Choice(['SSD', 'AMSD', 'DMSD']), 
+@click.option('--domain-type', type=click.Choice(_DOMAIN_TYPES), 
               default='SSD', help='Type of security domain to create')
 @click.option('--privileges', default=0x80, help='Privilege bytes (hex)')
 @click.pass_context
@@ -325,10 +503,11 @@ def create_security_domain(ctx, aid: str, domain_type: str, privileges: int):
         return
     
     try:
-        aid_bytes = bytes.fromhex(aid)
+        aid_bytes = _parse_aid(aid)
         cli_obj.print_info(f"Creating {domain_type} with AID: {aid}")
         
         if cli_obj.gp_manager.create_security_domain(aid_bytes, domain_type, privileges):
+            cli_obj.invalidate_card_cache()
             cli_obj.print_success(f"Security domain created successfully")
         else:
             cli_obj.print_error("Failed to create security domain")
@@ -341,7 +520,7 @@ def create_security_domain(ctx, aid: str, domain_type: str, privileges: int):
 
 @cli.command()
 @click.argument('target_aid', type=str)
-@click.option('--operation', type=click.Choice(['lock', 'unlock', 'terminate']),
+@click.option('--operation', type=click.Choice(_CLFDB_OPERATIONS),
               required=True, help='CLFDB operation to perform')
 @click.pass_context
 def clfdb(ctx, target_aid: str, operation: str):
@@ -357,10 +536,11 @@ def clfdb(ctx, target_aid: str, operation: str):
         return
     
     try:
-        aid_bytes = bytes.fromhex(target_aid)
+        aid_bytes = _parse_aid(target_aid)
         cli_obj.print_info(f"Performing CLFDB {operation} on: {target_aid}")
         
         if cli_obj.gp_manager.perform_clfdb(aid_bytes, operation):
+            cli_obj.invalidate_card_cache()
             cli_obj.print_success(f"CLFDB {operation} completed successfully")
         else:
             cli_obj.print_error(f"CLFDB {operation} failed")
@@ -388,12 +568,13 @@ def extradite(ctx, object_aid: str, target_sd_aid: str):
         return
     
     try:
-        object_aid_bytes = bytes.fromhex(object_aid)
-        target_aid_bytes = bytes.fromhex(target_sd_aid)
+        object_aid_bytes = _parse_aid(object_aid)
+        target_aid_bytes = _parse_aid(target_sd_aid)
         
         cli_obj.print_info(f"Extraditing {object_aid} to {target_sd_aid}")
         
         if cli_obj.gp_manager.extradite_object(object_aid_bytes, target_aid_bytes):
+            cli_obj.invalidate_card_cache()
             cli_obj.print_success("Extradition completed successfully")
         else:
             cli_obj.print_error("Extradition failed")
@@ -424,8 +605,9 @@ def visualize(ctx, output_dir: Optional[str]):
         cli_obj.print_info("Collecting card data for visualization...")
         
         # Get current card state
-        domains = cli_obj.gp_manager.list_security_domains()
-        applications = cli_obj.gp_manager.list_applications()
+        with cli_obj.sc_manager.transaction():
+            domains = cli_obj.get_security_domains()
+            applications = cli_obj.get_applications()
         
         if not domains and not applications:
             cli_obj.print_warning("No security domains or applications found to visualize")
@@ -438,9 +620,8 @@ def visualize(ctx, output_dir: Optional[str]):
         
         if output_files:
             cli_obj.print_success(f"Generated {len(output_files)} visualization(s):")
-            for file_path in output_files:
-                if os.path.exists(file_path):
-                    print(f"  • {file_path}")
+            print('\n'.join(f"  • {file_path}" for file_path in output_files
+                            if os.path.exists(file_path)))
         else:
             cli_obj.print_warning("No visualizations were generated")
             
@@ -463,9 +644,10 @@ def card_info(ctx):
         if cli_obj.sc_manager.active_reader:
             atr = cli_obj.sc_manager.active_reader.get_atr()
             print(f"\n{Fore.CYAN}Card Information:{Style.RESET_ALL}")
-            print(f"ATR: {toHexString(atr)}")
+            print(f"ATR: {atr.hex(' ').upper()}")
         
         # Get card-specific information
+        cli_obj.ensure_card_manager()
         card_info = cli_obj.gp_manager.get_card_info()
         
         if card_info:
@@ -473,8 +655,9 @@ def card_info(ctx):
                 print(f"{key}: {value}")
         
         # Status summary
-        domains = cli_obj.gp_manager.list_security_domains()
-        applications = cli_obj.gp_manager.list_applications()
+        with cli_obj.sc_manager.transaction():
+            domains = cli_obj.get_security_domains()
+            applications = cli_obj.get_applications()
         
         print(f"\n{Fore.CYAN}Summary:{Style.RESET_ALL}")
         print(f"Security Domains: {len(domains)}")
@@ -516,39 +699,35 @@ def keyset():
 @click.option('--value-set', help='Filter by value set')
 @click.option('--protocol', help='Filter by protocol (SCP02/SCP03)')
 @click.pass_context
-def list_keysets(ctx, value_set: str, protocol: str):
+def list_keysets_db(ctx, value_set: str, protocol: str):
     """List available keysets"""
+    from tabulate import tabulate
+    
     cli_obj = ctx.obj['cli']
     
     try:
-        db_manager = DatabaseManager()
-        keysets = db_manager.get_keysets(value_set=value_set, protocol=protocol)
+        keysets = cli_obj.db_manager.get_keysets(value_set=value_set, protocol=protocol)
         
         if keysets:
             cli_obj.print_success(f"Found {len(keysets)} keyset(s):")
             
-            # Group by value set
-            by_value_set = {}
-            for keyset in keysets:
-                if keyset.value_set not in by_value_set:
-                    by_value_set[keyset.value_set] = []
-                by_value_set[keyset.value_set].append(keyset)
-            
-            for vs, ks_list in by_value_set.items():
+            # Group by value set (get_keysets returns rows ordered by value_set)
+            for vs, ks_list in itertools.groupby(keysets, key=attrgetter('value_set')):
                 print(f"\n{Fore.YELLOW}Value Set: {vs}{Style.RESET_ALL}")
-                table_data = []
-                for ks in ks_list:
-                    table_data.append([
+                table_data = [
+                    [
                         ks.name,
                         ks.protocol,
                         f"v{ks.key_version}",
                         f"L{ks.security_level}",
-                        ks.description[:40] + "..." if len(ks.description) > 40 else ks.description
-                    ])
+                        _trunc(ks.description)
+                    ]
+                    for ks in ks_list
+                ]
                 
                 print(tabulate(table_data, 
                              headers=['Name', 'Protocol', 'Version', 'Security', 'Description'],
-                             tablefmt='grid'))
+                             tablefmt='simple'))
         else:
             cli_obj.print_warning("No keysets found")
     except Exception as e:
@@ -558,7 +737,7 @@ def list_keysets(ctx, value_set: str, protocol: str):
 @keyset.command('add')
 @click.argument('name')
 @click.argument('value_set')
-@click.option('--protocol', type=click.Choice(['SCP02', 'SCP03']), required=True, help='Security protocol')
+@click.option('--protocol', type=click.Choice(_PROTOCOLS), required=True, help='Security protocol')
 @click.option('--enc-key', required=True, help='Encryption key (hex)')
 @click.option('--mac-key', required=True, help='MAC key (hex)')
 @click.option('--dek-key', required=True, help='DEK key (hex)')
@@ -573,12 +752,8 @@ def add_keyset(ctx, name: str, value_set: str, protocol: str, enc_key: str,
     
     try:
         # Validate hex keys
-        for key_name, key_value in [('enc-key', enc_key), ('mac-key', mac_key), ('dek-key', dek_key)]:
-            try:
-                bytes.fromhex(key_value)
-                if len(key_value) not in [32, 48]:  # 16 or 24 bytes in hex
-                    raise ValueError(f"Invalid key length")
-            except ValueError:
+        for key_name, key_value in (('enc-key', enc_key), ('mac-key', mac_key), ('dek-key', dek_key)):
+            if not _HEX_KEY_RE.fullmatch(key_value):
                 cli_obj.print_error(f"Invalid {key_name}: must be 32 or 48 hex characters")
                 return
         
@@ -633,8 +808,7 @@ def list_value_sets(ctx):
         value_sets = cli_obj.config_manager.get_value_sets()
         if value_sets:
             cli_obj.print_success(f"Available value sets:")
-            for vs in value_sets:
-                print(f"  • {vs}")
+            print('\n'.join(f"  • {vs}" for vs in value_sets))
         else:
             cli_obj.print_warning("No value sets found")
     except Exception as e:
@@ -653,21 +827,22 @@ def ota():
 
 @ota.command('clfdb')
 @click.argument('target_aid')
-@click.argument('operation', type=click.Choice(['LOCK', 'UNLOCK', 'TERMINATE', 'MAKE_SELECTABLE']))
+@click.argument('operation', type=click.Choice(_OTA_OPERATIONS))
 @click.option('--template', default='clfdb_lock', help='OTA template name')
 @click.option('--keyset', required=True, help='Keyset name for encryption/MAC')
 @click.option('--value-set', default='production', help='Value set containing keyset')
 @click.pass_context
 def create_clfdb_ota(ctx, target_aid: str, operation: str, template: str, keyset: str, value_set: str):
     """Create OTA SMS-PP envelope for CLFDB operation"""
+    from src.ota_manager import OTAManager
+    
     cli_obj = ctx.obj['cli']
     
     try:
-        db_manager = DatabaseManager()
-        ota_manager = OTAManager(db_manager)
+        ota_manager = OTAManager(cli_obj.db_manager)
         
         # Validate AID
-        if not ota_manager.validate_aid(target_aid):
+        if not _validate_aid(target_aid):
             cli_obj.print_error("Invalid AID format (must be 5-16 bytes in hex)")
             return
         
@@ -696,14 +871,15 @@ def create_clfdb_ota(ctx, target_aid: str, operation: str, template: str, keyset
 @click.pass_context
 def create_custom_ota(ctx, target_aid: str, apdu: str, template: str, keyset: str, value_set: str):
     """Create OTA SMS-PP envelope with custom APDU"""
+    from src.ota_manager import OTAManager
+    
     cli_obj = ctx.obj['cli']
     
     try:
-        db_manager = DatabaseManager()
-        ota_manager = OTAManager(db_manager)
+        ota_manager = OTAManager(cli_obj.db_manager)
         
         # Validate AID and APDU
-        if not ota_manager.validate_aid(target_aid):
+        if not _validate_aid(target_aid):
             cli_obj.print_error("Invalid AID format (must be 5-16 bytes in hex)")
             return
         
@@ -730,34 +906,38 @@ def create_custom_ota(ctx, target_aid: str, apdu: str, template: str, keyset: st
 @ota.command('list')
 @click.option('--status', help='Filter by status')
 @click.option('--target-aid', help='Filter by target AID')
+@click.option('--limit', type=int, default=100, help='Maximum number of messages to list')
+@click.option('--offset', type=int, default=0, help='Number of messages to skip')
 @click.pass_context
-def list_ota_messages(ctx, status: str, target_aid: str):
+def list_ota_messages(ctx, status: str, target_aid: str, limit: int, offset: int):
     """List OTA messages"""
     cli_obj = ctx.obj['cli']
     
     try:
-        db_manager = DatabaseManager()
-        messages = db_manager.get_ota_messages(status=status, target_aid=target_aid)
+        total = cli_obj.db_manager.count_ota_messages(
+            status=status, target_aid=target_aid, limit=limit, offset=offset
+        )
+        if not total:
+            cli_obj.print_warning("No OTA messages found")
+            return
         
-        if messages:
-            cli_obj.print_success(f"Found {len(messages)} OTA message(s):")
-            
-            table_data = []
+        cli_obj.print_success(f"Found {total} OTA message(s):")
+        print(_ota_list_line(name for name, _ in _OTA_LIST_COLUMNS))
+        print(_ota_list_line("-" * width for _, width in _OTA_LIST_COLUMNS))
+        
+        # Print each chunk as it arrives instead of materializing every row
+        for messages in cli_obj.db_manager.get_ota_messages_iter(
+            status=status, target_aid=target_aid, limit=limit, offset=offset
+        ):
             for msg in messages:
-                table_data.append([
+                print(_ota_list_line((
                     msg.id,
                     msg.target_aid,
                     msg.operation,
                     msg.status,
                     msg.created_at[:19],  # Show date/time without microseconds
-                    msg.sms_tpdu[:20] + "..." if len(msg.sms_tpdu) > 20 else msg.sms_tpdu
-                ])
-            
-            print(tabulate(table_data,
-                         headers=['ID', 'Target AID', 'Operation', 'Status', 'Created', 'SMS TPDU'],
-                         tablefmt='grid'))
-        else:
-            cli_obj.print_warning("No OTA messages found")
+                    _trunc(msg.sms_tpdu, 23)
+                )))
     except Exception as e:
         cli_obj.print_error(f"Error listing OTA messages: {e}")
 
@@ -767,28 +947,30 @@ def list_ota_messages(ctx, status: str, target_aid: str):
 @click.pass_context
 def list_ota_templates(ctx, type: str):
     """List available OTA templates"""
+    from tabulate import tabulate
+    
     cli_obj = ctx.obj['cli']
     
     try:
-        db_manager = DatabaseManager()
-        templates = db_manager.get_ota_templates(template_type=type)
+        templates = cli_obj.db_manager.get_ota_templates(template_type=type)
         
         if templates:
             cli_obj.print_success(f"Found {len(templates)} OTA template(s):")
             
-            table_data = []
-            for tmpl in templates:
-                table_data.append([
+            table_data = [
+                [
                     tmpl.name,
                     tmpl.template_type,
                     tmpl.spi,
                     tmpl.tar,
-                    tmpl.description[:40] + "..." if len(tmpl.description) > 40 else tmpl.description
-                ])
+                    _trunc(tmpl.description)
+                ]
+                for tmpl in templates
+            ]
             
             print(tabulate(table_data,
                          headers=['Name', 'Type', 'SPI', 'TAR', 'Description'],
-                         tablefmt='grid'))
+                         tablefmt='simple'))
         else:
             cli_obj.print_warning("No OTA templates found")
     except Exception as e:
@@ -2,18 +2,27 @@
 Advanced example demonstrating secure channel operations and security domain management.
 """
 
-import sys
 import os
+from collections import Counter
+from itertools import chain
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from src import (
+    SmartcardManager,
+    APDUCommand,
+    GlobalPlatformManager,
+    SecureChannelManager,
+    KeySet,
+    ConfigManager,
+    SecurityDomainVisualizer,
+)
 
-from smartcard_manager import SmartcardManager, APDUCommand
-from globalplatform import GlobalPlatformManager
-from secure_channel import SecureChannelManager, KeySet
-from config_manager import ConfigManager
-from visualization import SecurityDomainVisualizer
-from smartcard.util import toHexString
+# Keysets tried in order when opening a secure channel
+TRIAL_KEYSETS = ('default_scp03', 'default_scp02', 'test_keyset')
+
+
+def _hex(data: bytes) -> str:
+    """Format bytes as space-separated uppercase hex, like toHexString"""
+    return bytes(data).hex(' ').upper()
 
 
 def demonstrate_secure_operations():
@@ -52,36 +61,28 @@ def demonstrate_secure_operations():
             print(f"{key}: {value}")
         
         # List current state
+        domains, applications = gp_manager.list_all()
+        
         print("\n=== Current Security Domains ===")
-        domains = gp_manager.list_security_domains()
-        for domain in domains:
-            print(f"  {domain}")
+        print("".join(f"  {domain}\n" for domain in domains), end="")
         
         print("\n=== Current Applications ===")
-        applications = gp_manager.list_applications()
-        for app in applications:
-            print(f"  {app}")
+        print("".join(f"  {app}\n" for app in applications), end="")
         
         # Try to establish secure channel
         print("\n=== Establishing Secure Channel ===")
         
-        # Try different keysets
-        keyset_names = ['default_scp03', 'default_scp02', 'test_keyset']
-        secure_channel_established = False
-        
-        for keyset_name in keyset_names:
-            keyset = config_manager.get_keyset(keyset_name)
-            if keyset:
-                print(f"Trying keyset: {keyset_name} ({keyset.protocol})")
-                
-                if secure_channel.establish_secure_channel(keyset, security_level=1):
-                    print(f"✓ Secure channel established with {keyset_name}")
-                    secure_channel_established = True
-                    break
-                else:
-                    print(f"✗ Failed with {keyset_name}")
+        # Try different keysets, resolving the configured ones up front
+        candidates = [(name, keyset) for name in TRIAL_KEYSETS
+                      if (keyset := config_manager.get_keyset(name))]
+        for keyset_name, keyset in candidates:
+            print(f"Candidate keyset: {keyset_name} ({keyset.protocol})")
         
-        if not secure_channel_established:
+        keyset_name = secure_channel.establish_first_secure_channel(candidates, security_level=1)
+        secure_channel_established = keyset_name is not None
+        if secure_channel_established:
+            print(f"✓ Secure channel established with {keyset_name}")
+        else:
             print("Could not establish secure channel with any keyset")
             print("Continuing with basic operations...")
         
@@ -91,17 +92,17 @@ def demonstrate_secure_operations():
             
             # Example: Create a new security domain
             new_sd_aid = bytes.fromhex("A000000151DEAD01")
-            print(f"Creating new SSD with AID: {toHexString(new_sd_aid)}")
+            print(f"Creating new SSD with AID: {_hex(new_sd_aid)}")
             
             try:
-                if gp_manager.create_security_domain(new_sd_aid, "SSD", 0x80):
+                new_domain = gp_manager.create_security_domain(new_sd_aid, "SSD", 0x80)
+                if new_domain:
                     print("✓ Security domain created successfully")
                     
-                    # Refresh domain list
-                    domains = gp_manager.list_security_domains()
+                    # Apply the returned delta instead of re-reading the card
+                    domains.append(new_domain)
                     print("Updated security domains:")
-                    for domain in domains:
-                        print(f"  {domain}")
+                    print("".join(f"  {domain}\n" for domain in domains), end="")
                 else:
                     print("✗ Failed to create security domain")
             except Exception as e:
@@ -110,7 +111,7 @@ def demonstrate_secure_operations():
             # Example: CLFDB operations
             if domains:
                 target_domain = domains[-1]  # Use last domain
-                print(f"\nDemonstrating CLFDB on: {toHexString(target_domain.aid)}")
+                print(f"\nDemonstrating CLFDB on: {_hex(target_domain.aid)}")
                 
                 # Lock the domain
                 try:
@@ -135,8 +136,7 @@ def demonstrate_secure_operations():
         print("\n=== Generating Visualizations ===")
         
         # Refresh data for visualization
-        final_domains = gp_manager.list_security_domains()
-        final_applications = gp_manager.list_applications()
+        final_domains, final_applications = gp_manager.list_all()
         
         if final_domains or final_applications:
             output_files = visualizer.generate_all_visualizations(final_domains, final_applications)
@@ -154,23 +154,15 @@ def demonstrate_secure_operations():
         print(f"Secure Channel Used: {secure_channel_established}")
         
         # Detailed breakdown
-        domain_types = {}
-        for domain in final_domains:
-            domain_types[domain.domain_type] = domain_types.get(domain.domain_type, 0) + 1
+        domain_types = Counter(d.domain_type for d in final_domains)
         
         print("\nDomain Type Breakdown:")
         for domain_type, count in domain_types.items():
             print(f"  {domain_type}: {count}")
         
         # Lifecycle state analysis
-        lifecycle_states = {}
-        for domain in final_domains:
-            lc_name = domain.life_cycle.name
-            lifecycle_states[lc_name] = lifecycle_states.get(lc_name, 0) + 1
-        
-        for app in final_applications:
-            lc_name = app.life_cycle.name
-            lifecycle_states[lc_name] = lifecycle_states.get(lc_name, 0) + 1
+        lifecycle_states = Counter(x.life_cycle.name
+                                   for x in chain(final_domains, final_applications))
         
         print("\nLifecycle State Distribution:")
         for state, count in lifecycle_states.items():
@@ -2,17 +2,13 @@
 Example script demonstrating basic smartcard operations.
 """
 
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from smartcard_manager import SmartcardManager
-from globalplatform import GlobalPlatformManager
-from secure_channel import SecureChannelManager
-from config_manager import ConfigManager
-from visualization import SecurityDomainVisualizer
+from src import (
+    SmartcardManager,
+    GlobalPlatformManager,
+    SecureChannelManager,
+    ConfigManager,
+    SecurityDomainVisualizer,
+)
 
 
 def main():
@@ -47,17 +43,14 @@ def main():
             if gp_manager.select_card_manager():
                 print("Card Manager selected")
                 
-                # List security domains
+                # List security domains and applications in one pass
+                domains, applications = gp_manager.list_all()
+                
                 print("\nSecurity Domains:")
-                domains = gp_manager.list_security_domains()
-                for domain in domains:
-                    print(f"  {domain}")
+                print("".join(f"  {domain}\n" for domain in domains), end="")
                 
-                # List applications
                 print("\nApplications:")
-                applications = gp_manager.list_applications()
-                for app in applications:
-                    print(f"  {app}")
+                print("".join(f"  {app}\n" for app in applications), end="")
                 
                 # Try to establish secure channel if keyset available
                 keyset = config_manager.get_keyset('default_scp03')
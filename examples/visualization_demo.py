@@ -2,90 +2,53 @@
 Example demonstrating visualization capabilities of the tool.
 """
 
-import sys
 import os
+from collections import Counter
+from itertools import chain
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import numpy as np
 
-from globalplatform import SecurityDomainInfo, ApplicationInfo, LifeCycleState
-from visualization import SecurityDomainVisualizer
+from src import SecurityDomainInfo, ApplicationInfo, LifeCycleState, SecurityDomainVisualizer
+
+
+# Sample card contents, parsed once at import: (AID, life cycle, privileges, type)
+_SAMPLE_SDS = (
+    (bytes.fromhex("A000000151000000"), LifeCycleState.SECURED, 0xA0, "ISD"),
+    (bytes.fromhex("A000000151100000"), LifeCycleState.SELECTABLE, 0xC0, "SSD"),
+    (bytes.fromhex("A000000151200000"), LifeCycleState.PERSONALIZED, 0x80, "AMSD"),
+    (bytes.fromhex("A000000151300000"), LifeCycleState.SELECTABLE, 0xE0, "DMSD"),
+    (bytes.fromhex("A000000151400000"), LifeCycleState.LOCKED, 0x80, "SSD"),
+)
+
+# (AID, life cycle, privileges)
+_SAMPLE_APPS = (
+    (bytes.fromhex("A0000001515555AA"), LifeCycleState.SELECTABLE, 0x00),
+    (bytes.fromhex("A0000001515555BB"), LifeCycleState.PERSONALIZED, 0x00),
+    (bytes.fromhex("A0000001515555CC"), LifeCycleState.INSTALLED, 0x00),
+    (bytes.fromhex("A0000001515555DD"), LifeCycleState.BLOCKED, 0x00),
+    (bytes.fromhex("A0000001515555EE"), LifeCycleState.LOCKED, 0x00),
+    (bytes.fromhex("A0000001515555FF"), LifeCycleState.TERMINATED, 0x00),
+)
 
 
 def create_sample_data():
     """Create sample security domains and applications for demonstration"""
     
-    # Sample security domains
+    # Fresh dataclass instances each call; the immutable AID bytes are shared
     security_domains = [
         SecurityDomainInfo(
-            aid=bytes.fromhex("A000000151000000"),
-            life_cycle=LifeCycleState.SECURED,
-            privileges=0xA0,
-            domain_type="ISD",
-            associated_applications=[]
-        ),
-        SecurityDomainInfo(
-            aid=bytes.fromhex("A000000151100000"),
-            life_cycle=LifeCycleState.SELECTABLE,
-            privileges=0xC0,
-            domain_type="SSD",
-            associated_applications=[]
-        ),
-        SecurityDomainInfo(
-            aid=bytes.fromhex("A000000151200000"),
-            life_cycle=LifeCycleState.PERSONALIZED,
-            privileges=0x80,
-            domain_type="AMSD",
-            associated_applications=[]
-        ),
-        SecurityDomainInfo(
-            aid=bytes.fromhex("A000000151300000"),
-            life_cycle=LifeCycleState.SELECTABLE,
-            privileges=0xE0,
-            domain_type="DMSD",
-            associated_applications=[]
-        ),
-        SecurityDomainInfo(
-            aid=bytes.fromhex("A000000151400000"),
-            life_cycle=LifeCycleState.LOCKED,
-            privileges=0x80,
-            domain_type="SSD",
+            aid=aid,
+            life_cycle=life_cycle,
+            privileges=privileges,
+            domain_type=domain_type,
             associated_applications=[]
         )
+        for aid, life_cycle, privileges, domain_type in _SAMPLE_SDS
     ]
     
-    # Sample applications
     applications = [
-        ApplicationInfo(
-            aid=bytes.fromhex("A0000001515555AA"),
-            life_cycle=LifeCycleState.SELECTABLE,
-            privileges=0x00
-        ),
-        ApplicationInfo(
-            aid=bytes.fromhex("A0000001515555BB"),
-            life_cycle=LifeCycleState.PERSONALIZED,
-            privileges=0x00
-        ),
-        ApplicationInfo(
-            aid=bytes.fromhex("A0000001515555CC"),
-            life_cycle=LifeCycleState.INSTALLED,
-            privileges=0x00
-        ),
-        ApplicationInfo(
-            aid=bytes.fromhex("A0000001515555DD"),
-            life_cycle=LifeCycleState.BLOCKED,
-            privileges=0x00
-        ),
-        ApplicationInfo(
-            aid=bytes.fromhex("A0000001515555EE"),
-            life_cycle=LifeCycleState.LOCKED,
-            privileges=0x00
-        ),
-        ApplicationInfo(
-            aid=bytes.fromhex("A0000001515555FF"),
-            life_cycle=LifeCycleState.TERMINATED,
-            privileges=0x00
-        )
+        ApplicationInfo(aid=aid, life_cycle=life_cycle, privileges=privileges)
+        for aid, life_cycle, privileges in _SAMPLE_APPS
     ]
     
     return security_domains, applications
@@ -107,38 +70,19 @@ def demonstrate_visualizations():
     print("\nGenerating visualizations...")
     
     try:
-        # Generate hierarchy diagram
-        print("  • Creating hierarchy diagram...")
-        hierarchy_path = visualizer.create_hierarchy_diagram(
-            security_domains, applications, "demo_hierarchy.png"
-        )
-        print(f"    ✓ Saved to: {hierarchy_path}")
-        
-        # Generate network graph
-        print("  • Creating network graph...")
-        network_path = visualizer.create_network_graph(
-            security_domains, applications, "demo_network.png"
+        # Each figure is rendered once; the names keep the demo's filenames
+        print("  • Generating hierarchy, network, privilege and lifecycle views...")
+        all_files = visualizer.generate_all_visualizations(
+            security_domains, applications,
+            names={
+                'hierarchy': "demo_hierarchy.png",
+                'network': "demo_network.png",
+                'privileges': "demo_privileges.png",
+                'lifecycle': "demo_lifecycle.png",
+            }
         )
-        print(f"    ✓ Saved to: {network_path}")
-        
-        # Generate privilege matrix
-        print("  • Creating privilege matrix...")
-        matrix_path = visualizer.create_privilege_matrix(
-            security_domains, applications, "demo_privileges.png"
-        )
-        print(f"    ✓ Saved to: {matrix_path}")
-        
-        # Generate lifecycle timeline
-        print("  • Creating lifecycle timeline...")
-        timeline_path = visualizer.create_lifecycle_timeline(
-            security_domains, applications, "demo_lifecycle.png"
-        )
-        print(f"    ✓ Saved to: {timeline_path}")
-        
-        # Generate all visualizations at once
-        print("  • Generating complete visualization set...")
-        all_files = visualizer.generate_all_visualizations(security_domains, applications)
-        print(f"    ✓ Generated {len(all_files)} files")
+        for file_path in all_files:
+            print(f"    ✓ Saved to: {file_path}")
         
         print(f"\n✓ All visualizations completed successfully!")
         print(f"Output directory: {visualizer.output_dir}")
@@ -146,9 +90,11 @@ def demonstrate_visualizations():
         # Summary of generated files
         print("\nGenerated files:")
         for file_path in all_files:
-            if os.path.exists(file_path):
-                file_size = os.path.getsize(file_path)
-                print(f"  • {os.path.basename(file_path)} ({file_size:,} bytes)")
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                continue
+            print(f"  • {os.path.basename(file_path)} ({st.st_size:,} bytes)")
         
     except Exception as e:
         print(f"✗ Error generating visualizations: {e}")
@@ -217,33 +163,31 @@ def demonstrate_custom_visualization():
         print(f"  Total Objects: {len(security_domains) + len(applications)}")
         
         # Domain type analysis
-        domain_counts = {}
-        for domain in security_domains:
-            domain_counts[domain.domain_type] = domain_counts.get(domain.domain_type, 0) + 1
+        domain_counts = Counter(d.domain_type for d in security_domains)
         
         print("  Domain Types:")
         for domain_type, count in sorted(domain_counts.items()):
             print(f"    {domain_type}: {count}")
         
         # Lifecycle analysis
-        lifecycle_counts = {}
-        for domain in security_domains:
-            lc_name = domain.life_cycle.name
-            lifecycle_counts[lc_name] = lifecycle_counts.get(lc_name, 0) + 1
-        
-        for app in applications:
-            lc_name = app.life_cycle.name
-            lifecycle_counts[lc_name] = lifecycle_counts.get(lc_name, 0) + 1
+        lc_values = np.fromiter(
+            (x.life_cycle.value for x in chain(security_domains, applications)),
+            dtype=np.uint8, count=len(security_domains) + len(applications)
+        )
+        lc_bins = np.bincount(lc_values, minlength=256)
+        lifecycle_counts = {LifeCycleState(int(v)).name: int(lc_bins[v])
+                            for v in np.flatnonzero(lc_bins)}
         
         print("  Lifecycle States:")
         for state, count in sorted(lifecycle_counts.items()):
             print(f"    {state}: {count}")
         
         # Privilege analysis
-        privilege_summary = {}
-        for domain in security_domains:
-            priv_key = f"0x{domain.privileges:02X}"
-            privilege_summary[priv_key] = privilege_summary.get(priv_key, 0) + 1
+        priv_values = np.fromiter((d.privileges for d in security_domains),
+                                  dtype=np.uint8, count=len(security_domains))
+        priv_bins = np.bincount(priv_values, minlength=256)
+        privilege_summary = {f"0x{int(v):02X}": int(priv_bins[v])
+                             for v in np.flatnonzero(priv_bins)}
         
         print("  Privilege Distribution:")
         for priv, count in sorted(privilege_summary.items()):
@@ -5,12 +5,18 @@ Provides a modern, user-friendly interface for all smartcard operations.
 
 import sys
 import os
-import threading
+import re
 import time
-from typing import Optional, List, Dict, Any
+import hashlib
+from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from queue import Empty, SimpleQueue
+from functools import cached_property, lru_cache, partial
+from typing import Optional, List, Dict, Any, TYPE_CHECKING
 from pathlib import Path
 import tkinter as tk
 from tkinter import messagebox, filedialog, ttk
+import tkinter.font as tkfont
 import customtkinter as ctk
 from PIL import Image, ImageTk
 
@@ -18,13 +24,328 @@ from PIL import Image, ImageTk
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.smartcard_manager import SmartcardManager, SmartcardException
-from src.globalplatform import GlobalPlatformManager, SecurityDomainInfo, ApplicationInfo
-from src.secure_channel import SecureChannelManager, KeySet
 from src.config_manager import ConfigManager
-from src.visualization import SecurityDomainVisualizer
-from src.database_manager import DatabaseManager, KeysetRecord, OTAMessage
-from src.ota_manager import OTAManager
-from smartcard.util import toHexString
+
+if TYPE_CHECKING:
+    from src.globalplatform import GlobalPlatformManager, SecurityDomainInfo, ApplicationInfo
+    from src.secure_channel import SecureChannelManager
+    from src.visualization import SecurityDomainVisualizer
+    from src.database_manager import DatabaseManager
+    from src.ota_manager import OTAManager
+
+# Most recent OTA messages shown in the history table
+OTA_HISTORY_LIMIT = 100
+
+# Milliseconds between drains of the worker -> UI thread callback queue
+UI_POLL_MS = 16
+
+# Treeview inserts in one sync above which the tree is unmapped meanwhile
+BULK_INSERT_ROWS = 50
+
+# Optional 24x24 PNG nav icons, named after the tab (dashboard.png, ...)
+ICON_DIR = Path(__file__).parent / "resources" / "icons"
+
+
+def _hex(data) -> str:
+    """Space-separated uppercase hex, as toHexString, via the built-in bytes.hex"""
+    return bytes(data).hex(' ').upper()
+
+
+@lru_cache(maxsize=256)
+def _aid_hex(aid: bytes) -> str:
+    """Format AID bytes as spaced upper-case hex (cached, AIDs repeat on every refresh)"""
+    return aid.hex(' ').upper()
+
+
+def _card_digest(domains, applications) -> bytes:
+    """Digest of the card registry as shown in the trees, to spot unchanged refreshes
+
+    Domain types follow from the AID and privileges, so they are not hashed.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for kind, objects in ((b"S", domains), (b"A", applications)):
+        digest.update(kind + len(objects).to_bytes(4, "big"))
+        for obj in objects:
+            digest.update(bytes((len(obj.aid), obj.life_cycle.value, obj.privileges)))
+            digest.update(obj.aid)
+    return digest.digest()
+
+
+def _write_lines(textbox, lines: List[str], replace: bool = False):
+    """Write lines to a CTkTextbox with a single insert instead of one per line"""
+    if replace:
+        textbox.delete("1.0", "end")
+    textbox.insert("end", "".join(f"{line}\n" for line in lines))
+
+
+def _make_tree(parent, spec, **kwargs) -> ttk.Treeview:
+    """Create a Treeview and set its headings and widths from a column spec"""
+    tree = ttk.Treeview(parent, columns=[col for col, _, _ in spec if col != "#0"], **kwargs)
+    for col, heading, width in spec:
+        tree.heading(col, text=heading)
+        tree.column(col, width=width)
+    return tree
+
+
+def _unmap(tree: ttk.Treeview):
+    """Take a pack- or grid-managed tree off screen; return a callable that restores it"""
+    manager = tree.winfo_manager()
+    if manager == "grid":
+        tree.grid_remove()
+        return tree.grid
+    if manager == "pack":
+        info = tree.pack_info()
+        slaves = tree.master.pack_slaves()
+        after = slaves[slaves.index(tree) + 1:]
+        tree.pack_forget()
+        if after:
+            # Keep the packing order so the scrollbar keeps its side
+            info["before"] = after[0]
+        return lambda: tree.pack(**info)
+    return lambda: None
+
+
+def _sync_tree(tree: ttk.Treeview, shown: Dict[str, tuple], rows, label: Optional[str] = None,
+               start: int = 0):
+    """Bring top-level Treeview items in line with ordered (iid, values) rows
+
+    shown maps each displayed iid to its (text, *values) row and is updated
+    in place. Only rows that were added, removed or changed cost a Tk call.
+    Rows kept across calls must stay in the same relative order (e.g. sorted
+    by name or by date, or in card registry order), so new rows can be
+    inserted at their final index. label, e.g. "SD {}", numbers the #0
+    column text by position, counting from start + 1. Large batches of new rows are inserted while
+    the tree is unmapped, so it is laid out once instead of per insert.
+    """
+    rows = list(rows)
+    columns = None
+    remap = None
+    if sum(iid not in shown for iid, _ in rows) >= BULK_INSERT_ROWS:
+        remap = _unmap(tree)
+    wanted = {iid for iid, _ in rows}
+    stale = [iid for iid in shown if iid not in wanted]
+    if stale:
+        tree.delete(*stale)
+        for iid in stale:
+            del shown[iid]
+    for index, (iid, values) in enumerate(rows):
+        text = label.format(start + index + 1) if label else ""
+        row = (text, *values)
+        old = shown.get(iid)
+        if old is None:
+            tree.insert("", index, iid=iid, text=text, values=values, tags=(iid,))
+        elif old != row:
+            changed = [i for i, (a, b) in enumerate(zip(old, row)) if a != b]
+            if len(changed) == 1 and len(old) == len(row):
+                # e.g. an OTA status flip: send just that cell to Tcl
+                if changed[0] == 0:
+                    tree.item(iid, text=text)
+                else:
+                    if columns is None:
+                        columns = tree["columns"]
+                    tree.set(iid, columns[changed[0] - 1], row[changed[0]])
+            else:
+                tree.item(iid, text=text, values=values)
+        shown[iid] = row
+    if remap:
+        remap()
+
+
+class _VirtualTree:
+    """Keep only the rows that fit a Treeview's viewport in Tk
+
+    rows holds the full ordered (iid, values) model. A window of it starting
+    at offset is synced into the tree, and the vertical scrollbar is driven
+    with the window's fraction of the model instead of the tree's own yview.
+    The selected iid is kept in the model too, since Tk drops it along with
+    the item when the row scrolls out of the window.
+    """
+    
+    def __init__(self, tree: ttk.Treeview, scrollbar: ttk.Scrollbar, label: Optional[str] = None):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.label = label
+        self.rows: List[tuple] = []
+        self.shown: Dict[str, tuple] = {}
+        self.offset = 0
+        self.selected: Optional[str] = None
+        self._after_id = None
+        
+        # The themes leave -rowheight at Tk's fixed 20 px, which is too short for
+        # larger fonts or Tk scaling; size rows from the font so visible() can count them
+        style = ttk.Style(tree)
+        font = tkfont.Font(root=tree, font=style.lookup("Treeview", "font") or "TkDefaultFont")
+        self.row_height = max(20, font.metrics("linespace") + 4)
+        style.configure("Treeview", rowheight=self.row_height)
+        
+        scrollbar.configure(command=self.scroll)
+        # Resizes and wheel bursts are coalesced into one render per frame
+        tree.bind("<Configure>", lambda e: self.schedule())
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            tree.bind(sequence, self.wheel)
+        tree.bind("<<TreeviewSelect>>", self._on_select)
+        for sequence in ("<Up>", "<Down>"):
+            tree.bind(sequence, self.key)
+    
+    def set_rows(self, rows):
+        """Replace the model and render the current window right away"""
+        self.rows = list(rows)
+        if self.selected is not None and all(iid != self.selected for iid, _ in self.rows):
+            self.selected = None
+        self.render()
+    
+    def _on_select(self, event):
+        """Track the selected row in the model"""
+        selection = self.tree.selection()
+        if selection:
+            self.selected = selection[0]
+        elif self.selected in self.shown:
+            # Deselected while in view; a row that scrolled out stays selected
+            self.selected = None
+    
+    def visible(self) -> int:
+        """Number of rows that fit in the tree"""
+        height = self.tree.winfo_height()
+        if height <= 1:
+            # Not laid out yet; use the requested height in rows
+            return int(self.tree.cget("height"))
+        children = self.tree.get_children()
+        bbox = self.tree.bbox(children[0]) if children else ""
+        if bbox:
+            # Rows start below the headings, and the bottom border is as wide as the left
+            x, top = bbox[0], bbox[1]
+            return max(1, (height - top - x) // self.row_height)
+        # Nothing drawn yet; allow one row's worth of height for the headings
+        return max(1, height // self.row_height - 1)
+    
+    def schedule(self):
+        """Render once the current burst of events has been handled"""
+        if self._after_id is None:
+            self._after_id = self.tree.after(16, self._scheduled_render)
+    
+    def _scheduled_render(self):
+        """Run a scheduled render unless the tab has been dropped meanwhile"""
+        self._after_id = None
+        if self.tree.winfo_exists():
+            self.render()
+    
+    def render(self):
+        """Sync the rows inside the viewport into the tree"""
+        total = len(self.rows)
+        visible = self.visible()
+        self.offset = max(0, min(self.offset, total - visible))
+        first, last = self.offset, min(total, self.offset + visible)
+        
+        _sync_tree(self.tree, self.shown, self.rows[first:last], label=self.label, start=first)
+        # The window is the whole tree, so the tree itself never scrolls
+        if self.tree.yview()[0]:
+            self.tree.yview_moveto(0)
+        if self.selected in self.shown and self.selected not in self.tree.selection():
+            self.tree.selection_set(self.selected)
+        
+        if total:
+            self.scrollbar.set(first / total, last / total)
+        else:
+            self.scrollbar.set(0, 1)
+    
+    def scroll(self, action: str, *args):
+        """Scrollbar command moving the row window"""
+        if action == "moveto":
+            self.offset = round(float(args[0]) * len(self.rows))
+        elif action == "scroll":
+            step = self.visible() if args[1] == "pages" else 1
+            self.offset += int(args[0]) * step
+        self.schedule()
+    
+    def wheel(self, event):
+        """Scroll the row window with the mouse wheel"""
+        units = -3 if event.num == 4 or event.delta > 0 else 3
+        self.scroll("scroll", units, "units")
+        return "break"
+    
+    def key(self, event):
+        """Move the selection past the edge of the window with the arrow keys"""
+        step = -1 if event.keysym == "Up" else 1
+        children = self.tree.get_children()
+        if not children or self.tree.focus() != children[0 if step < 0 else -1]:
+            # Within the window Tk moves the selection itself
+            return None
+        index = self.offset + (0 if step < 0 else len(children) - 1) + step
+        if not 0 <= index < len(self.rows):
+            return "break"
+        self.offset += step
+        self.selected = self.rows[index][0]
+        self.render()
+        self.tree.focus(self.selected)
+        return "break"
+
+
+# Privileges are a single byte, so their "0xNN" cells are tabulated once
+_BYTE_HEX = tuple(f"0x{i:02X}" for i in range(256))
+
+_HEX_RE = re.compile(r'[0-9A-Fa-f]*')
+_KEY_HEX_RE = re.compile(r'[0-9A-Fa-f]{32}')
+_STRIP_WS = str.maketrans('', '', ' \t\r\n')
+
+
+def _parse_hex(text: str, min_bytes: int = 0, max_bytes: Optional[int] = None) -> Optional[bytes]:
+    """Parse whitespace-separated hex, or return None if it is malformed or out of bounds"""
+    text = text.translate(_STRIP_WS)
+    if len(text) & 1 or not _HEX_RE.fullmatch(text):
+        return None
+    size = len(text) // 2
+    if size < min_bytes or (max_bytes is not None and size > max_bytes):
+        return None
+    return bytes.fromhex(text)
+
+
+def _trunc(text: str, width: int = 16) -> str:
+    """Shorten text to width characters plus an ellipsis for table cells"""
+    return text if len(text) <= width else text[:width] + "..."
+
+
+def _keyset_row(keyset) -> tuple:
+    """Keyset table values for a KeysetRecord, with the keys shortened"""
+    return (
+        keyset.name,
+        keyset.key_version,
+        _trunc(keyset.enc_key),
+        _trunc(keyset.mac_key),
+        _trunc(keyset.dek_key),
+        keyset.protocol,
+        keyset.description or ""
+    )
+
+
+def _domain_row(domain) -> tuple:
+    """Security domain tree item as (AID key, values)"""
+    aid = _aid_hex(domain.aid)
+    return aid, (aid, domain.domain_type, domain.life_cycle.name, _BYTE_HEX[domain.privileges])
+
+
+def _app_row(app) -> tuple:
+    """Application tree item as (AID key, values)"""
+    aid = _aid_hex(app.aid)
+    return aid, (aid, app.life_cycle.name, _BYTE_HEX[app.privileges])
+
+
+@lru_cache(maxsize=OTA_HISTORY_LIMIT * 2)
+def _format_timestamp(created_at: str) -> str:
+    """Format a stored ISO timestamp for display, formatting each one only once"""
+    # datetime.isoformat() output is YYYY-MM-DDTHH:MM:SS[.ffffff], so slice it
+    if len(created_at) >= 19 and created_at[10] in "T ":
+        return f"{created_at[:10]} {created_at[11:19]}"
+    try:
+        return datetime.fromisoformat(created_at).strftime('%Y-%m-%d %H:%M:%S')
+    except (TypeError, ValueError):
+        return created_at
+
+
+@lru_cache(maxsize=64)
+def _load_image(path: str, size: tuple) -> ctk.CTkImage:
+    """Decode an image file once per (path, size) and reuse the CTkImage"""
+    return ctk.CTkImage(Image.open(path), size=size)
+
 
 # Set appearance mode and color theme
 ctk.set_appearance_mode("dark")  # Modes: "System" (standard), "Dark", "Light"
@@ -34,35 +355,182 @@ ctk.set_default_color_theme("blue")  # Themes: "blue" (standard), "green", "dark
 class SmartcardGUI:
     """Main GUI application for smartcard management"""
     
+    # Sidebar entries as (tab name, emoji, label); each opens show_<tab name>
+    NAV_BUTTONS = (
+        ("dashboard", "🏠", "Dashboard"),
+        ("connection", "🔌", "Connection"),
+        ("secure_channel", "🔐", "Secure Channel"),
+        ("security_domains", "🏢", "Security Domains"),
+        ("applications", "📱", "Applications"),
+        ("operations", "⚙️", "Operations"),
+        ("keysets", "🔑", "Keysets"),
+        ("ota", "📡", "OTA Management"),
+        ("visualization", "📊", "Visualization"),
+        ("settings", "🔧", "Settings"),
+    )
+    SECURITY_LEVELS = ("1 (MAC)", "2 (MAC+ENC)", "3 (MAC+ENC+RMAC)")
+    CLFDB_OPS = ("lock", "unlock", "terminate")
+    DOMAIN_TYPES = ("SSD", "AMSD", "DMSD")
+    THEMES = ("dark", "light", "system")
+    
+    # Treeview column specs as (column, heading, width); "#0" is the tree column
+    KEYSET_COLUMNS = (
+        ("Name", "Name", 120), ("Version", "Version", 80), ("ENC", "ENC", 100),
+        ("MAC", "MAC", 100), ("KEK", "KEK", 100), ("Protocol", "Protocol", 80),
+        ("Description", "Description", 200),
+    )
+    OTA_HISTORY_COLUMNS = (
+        ("Timestamp", "Timestamp", 150), ("Type", "Type", 100), ("AID", "AID", 150),
+        ("Status", "Status", 80), ("Message", "Message", 300),
+    )
+    SD_COLUMNS = (
+        ("#0", "Name", 100), ("AID", "AID", 120), ("Type", "Type", 120),
+        ("Lifecycle", "Lifecycle", 120), ("Privileges", "Privileges", 120),
+    )
+    APP_COLUMNS = (
+        ("#0", "Name", 100), ("AID", "AID", 150), ("Lifecycle", "Lifecycle", 150),
+        ("Privileges", "Privileges", 150),
+    )
+    
     def __init__(self):
-        # Initialize backend components
+        # Everything that talks to the card runs here, one job at a time:
+        # transaction() only locks out other processes, not a second thread on
+        # the same card handle. Results come back through _ui_queue
+        self._card_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ccm-card")
+        
+        # Opening the PC/SC context and reader scans never touch the card handle
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ccm-io")
+        self._refreshing: set = set()
+        self._card_refresh_future: Optional[Future] = None
+        self._card_refresh_pending = False  # a refresh was requested while one ran
+        
+        # SQLite reads run here so they never queue behind PC/SC work
+        self._db_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ccm-db")
+        
+        # Chart rendering runs here, one job at a time: pyplot and the shared
+        # visualizer's output_dir are not safe to use from two threads
+        self._viz_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ccm-viz")
+        self._viz_future: Optional[Future] = None
+        self._viz_dir_prepared: Optional[str] = None  # last directory made by a viz job
+        
+        # Initialize backend components; the rest are created on first use.
+        # The PC/SC context is opened on a worker while the config loads.
+        sc_future = self._io_pool.submit(SmartcardManager)
         self.config_manager = ConfigManager()
-        self.db_manager = DatabaseManager()  # Add database manager
-        self.ota_manager = OTAManager(self.db_manager)  # Add OTA manager
-        self.sc_manager = SmartcardManager()
-        self.gp_manager = GlobalPlatformManager(self.sc_manager)
-        self.secure_channel = SecureChannelManager(self.sc_manager)
-        self.visualizer = SecurityDomainVisualizer(
-            self.config_manager.get_visualization_output_dir()
-        )
+        self.sc_manager = sc_future.result()
         
         # Application state
         self.connected_reader: Optional[str] = None
         self.secure_channel_active = False
-        self.current_domains: List[SecurityDomainInfo] = []
-        self.current_applications: List[ApplicationInfo] = []
+        self.current_domains: List['SecurityDomainInfo'] = []
+        self.current_applications: List['ApplicationInfo'] = []
+        self._sd_display: List[tuple] = []  # (iid, values) rows formatted off the UI thread
+        self._app_display: List[tuple] = []
+        self._card_snapshot: Optional[bytes] = None  # _card_digest of the rows shown
+        # Card trees, created when their tab is first shown
+        self.sd_view: Optional[_VirtualTree] = None
+        self.app_view: Optional[_VirtualTree] = None
+        
+        # Keysets of the selected value set; only the visible rows are in the tree
+        self._all_keysets: List[Any] = []
+        self._ota_rows_shown: Dict[str, tuple] = {}
+        
+        # Keyset/value set names for combo boxes, reloaded after keyset edits
+        self._keysets_cache: Optional[List[str]] = None
+        self._value_sets_cache: Optional[List[str]] = None
+        self._keysets_by_name: Dict[tuple, Any] = {}  # (name, value set) -> KeysetRecord
+        
+        # Status bar text waiting for the next debounced flush
+        self._pending_status = ""
+        self._status_after_id: Optional[str] = None
+        
+        # Pending debounced keyset refresh after a value set change
+        self._keyset_refresh_after_id: Optional[str] = None
+        
+        # Selected value set, kept in step with value_set_var once the keysets tab exists
+        self._cached_value_set = "production"
+        
+        # Tab frames are built on first visit and then shown/hidden
+        self._tabs: Dict[str, ctk.CTkFrame] = {}
+        self._current_tab: Optional[str] = None
+        self._dashboard_key: Optional[tuple] = None
+        
+        # Sidebar status texts as last rendered, matching the initial labels
+        self._last_conn_text = "🔴 Disconnected"
+        self._last_secure_text = "🔒 No Secure Channel"
+        
+        # (fn, args) callbacks from worker threads, run by _drain_ui_queue
+        self._ui_queue: SimpleQueue = SimpleQueue()
         
         # Initialize GUI
         self.setup_gui()
+        self._drain_ui_queue()
+    
+    @cached_property
+    def db_manager(self) -> 'DatabaseManager':
+        """Keyset/OTA database, shared with the configuration manager"""
+        return self.config_manager.db_manager
+    
+    @cached_property
+    def ota_manager(self) -> 'OTAManager':
+        """OTA message manager"""
+        from src.ota_manager import OTAManager
+        return OTAManager(self.db_manager)
+    
+    @cached_property
+    def gp_manager(self) -> 'GlobalPlatformManager':
+        """GlobalPlatform manager bound to the smartcard manager"""
+        from src.globalplatform import GlobalPlatformManager
+        return GlobalPlatformManager(self.sc_manager)
+    
+    @cached_property
+    def secure_channel(self) -> 'SecureChannelManager':
+        """Secure channel manager bound to the smartcard manager"""
+        from src.secure_channel import SecureChannelManager
+        return SecureChannelManager(self.sc_manager)
+    
+    @cached_property
+    def visualizer(self) -> 'SecurityDomainVisualizer':
+        """Security domain visualizer (loads matplotlib on first use)"""
+        from src.visualization import SecurityDomainVisualizer
+        return SecurityDomainVisualizer(
+            self.config_manager.get_visualization_output_dir()
+        )
         
+    def font(self, size: int, weight: Optional[str] = None) -> ctk.CTkFont:
+        """Get the shared CTkFont for a size and weight, creating it on first use"""
+        key = (size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            font = ctk.CTkFont(size=size, weight=weight) if weight else ctk.CTkFont(size=size)
+            self._fonts[key] = font
+        return font
+    
     def setup_gui(self):
         """Initialize the GUI components"""
+        # Fix the scaling up front so widgets skip the per-widget DPI query
+        gui_config = self.config_manager.get_gui_config()
+        if not gui_config.automatic_dpi:
+            ctk.deactivate_automatic_dpi_awareness()
+        ctk.set_widget_scaling(gui_config.widget_scaling)
+        ctk.set_window_scaling(gui_config.window_scaling)
+        
         # Create main window
         self.root = ctk.CTk()
         self.root.title("Smartcard Management Tool")
         self.root.geometry("1400x900")
         self.root.minsize(1200, 800)
         
+        # Shared fonts, created once before any tab is shown
+        self._fonts: Dict[tuple, ctk.CTkFont] = {}
+        self.F_TITLE = self.font(24, "bold")
+        self.F_LOGO = self.font(20, "bold")
+        self.F_H2 = self.font(16, "bold")
+        self.F_LABEL = self.font(14, "bold")
+        self.F_NAV = self.font(14)
+        self.F_BODY = self.font(12)
+        self.F_SMALL = self.font(11)
+        
         # Configure grid
         self.root.grid_columnconfigure(1, weight=1)
         self.root.grid_rowconfigure(0, weight=1)
@@ -76,6 +544,9 @@ class SmartcardGUI:
         # Create status bar
         self.create_status_bar()
         
+        # Stop background work before the window goes away
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
         # Initialize content
         self.show_dashboard()
         
@@ -89,42 +560,34 @@ class SmartcardGUI:
         self.logo_label = ctk.CTkLabel(
             self.sidebar_frame, 
             text="🔐 Smartcard\nManagement", 
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=self.F_LOGO
         )
         self.logo_label.grid(row=0, column=0, padx=20, pady=(20, 10))
           # Navigation buttons
-        nav_buttons = [
-            ("🏠 Dashboard", self.show_dashboard),
-            ("🔌 Connection", self.show_connection),
-            ("🔐 Secure Channel", self.show_secure_channel),
-            ("🏢 Security Domains", self.show_security_domains),
-            ("📱 Applications", self.show_applications),
-            ("⚙️ Operations", self.show_operations),
-            ("🔑 Keysets", self.show_keysets),
-            ("📡 OTA Management", self.show_ota),
-            ("📊 Visualization", self.show_visualization),
-            ("🔧 Settings", self.show_settings),
-        ]
+        self._icons = self._load_nav_icons(name for name, *_ in self.NAV_BUTTONS)
         
         self.nav_buttons = []
-        for i, (text, command) in enumerate(nav_buttons):
+        for i, (name, emoji, label) in enumerate(self.NAV_BUTTONS):
+            icon = self._icons.get(name)
             btn = ctk.CTkButton(
                 self.sidebar_frame,
-                text=text,
-                command=command,
+                text=label if icon else f"{emoji} {label}",
+                image=icon,
+                compound="left",
+                command=getattr(self, f"show_{name}"),
                 width=240,
                 height=40,
-                font=ctk.CTkFont(size=14),
+                font=self.F_NAV,
                 anchor="w"
             )
-            btn.grid(row=i+1, column=0, padx=20, pady=5)
             self.nav_buttons.append(btn)
+        self._grid_nav_buttons()
         
         # Connection status
         self.connection_status = ctk.CTkLabel(
             self.sidebar_frame,
             text="🔴 Disconnected",
-            font=ctk.CTkFont(size=12)
+            font=self.F_BODY
         )
         self.connection_status.grid(row=11, column=0, padx=20, pady=10)
         
@@ -132,10 +595,34 @@ class SmartcardGUI:
         self.secure_status = ctk.CTkLabel(
             self.sidebar_frame,
             text="🔒 No Secure Channel",
-            font=ctk.CTkFont(size=12)
+            font=self.F_BODY
         )
         self.secure_status.grid(row=12, column=0, padx=20, pady=5)
         
+    def _grid_nav_buttons(self):
+        """Grid the nav buttons below the logo, in one Tcl script when scaling is fixed"""
+        if self.config_manager.get_gui_config().automatic_dpi:
+            # CTk re-grids with rescaled padding on DPI changes, so use its wrapper
+            for i, btn in enumerate(self.nav_buttons):
+                btn.grid(row=i+1, column=0, padx=20, pady=5)
+            return
+        
+        scaling = ctk.ScalingTracker.get_widget_scaling(self.sidebar_frame)
+        padx, pady = round(20 * scaling), round(5 * scaling)
+        self.sidebar_frame.tk.eval("\n".join(
+            f"grid {btn} -row {i+1} -column 0 -padx {padx} -pady {pady}"
+            for i, btn in enumerate(self.nav_buttons)
+        ))
+    
+    def _load_nav_icons(self, names) -> Dict[str, ctk.CTkImage]:
+        """Decode the nav icons found in ICON_DIR once; missing ones fall back to emoji text"""
+        icons = {}
+        for name in names:
+            path = ICON_DIR / f"{name}.png"
+            if path.is_file():
+                icons[name] = _load_image(str(path), (20, 20))
+        return icons
+    
     def create_main_content(self):
         """Create the main content area"""
         self.main_frame = ctk.CTkFrame(self.root)
@@ -147,7 +634,7 @@ class SmartcardGUI:
         self.content_frame = ctk.CTkFrame(self.main_frame)
         self.content_frame.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
         self.content_frame.grid_columnconfigure(0, weight=1)
-        self.content_frame.grid_rowconfigure(1, weight=1)
+        self.content_frame.grid_rowconfigure(0, weight=1)
         
     def create_status_bar(self):
         """Create the status bar"""
@@ -157,47 +644,124 @@ class SmartcardGUI:
         self.status_label = ctk.CTkLabel(
             self.status_frame,
             text="Ready",
-            font=ctk.CTkFont(size=11)
+            font=self.F_SMALL
         )
         self.status_label.pack(side="left", padx=10, pady=5)
         
     def update_status(self, message: str):
-        """Update the status bar"""
-        self.status_label.configure(text=message)
-        self.root.update_idletasks()
+        """Update the status bar, coalescing bursts to one redraw per 50 ms"""
+        self._pending_status = message
+        if self._status_after_id is None:
+            self._status_after_id = self.root.after(50, self._flush_status)
+    
+    def _flush_status(self):
+        """Show the most recent pending status message"""
+        self._status_after_id = None
+        self.status_label.configure(text=self._pending_status)
         
     def update_connection_status(self):
         """Update connection status display"""
-        if self.connected_reader:
-            self.connection_status.configure(text=f"🟢 {self.connected_reader}")
-        else:
-            self.connection_status.configure(text="🔴 Disconnected")
-            
-        if self.secure_channel_active:
-            self.secure_status.configure(text="🔓 Secure Channel Active")
-        else:
-            self.secure_status.configure(text="🔒 No Secure Channel")
+        conn_text = f"🟢 {self.connected_reader}" if self.connected_reader else "🔴 Disconnected"
+        if conn_text != self._last_conn_text:
+            self.connection_status.configure(text=conn_text)
+            self._last_conn_text = conn_text
+        
+        secure_text = "🔓 Secure Channel Active" if self.secure_channel_active else "🔒 No Secure Channel"
+        if secure_text != self._last_secure_text:
+            self.secure_status.configure(text=secure_text)
+            self._last_secure_text = secure_text
+        
+        # The dashboard shows connection and secure channel state
+        self._refresh_dashboard()
     
-    def clear_content(self):
-        """Clear the main content area"""
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+    def _show_tab(self, name: str, build):
+        """Show a tab, building its frame on first visit and reusing it afterwards"""
+        if name == self._current_tab and name in self._tabs:
+            return
+        
+        tab = self._tabs.get(name)
+        if tab is None:
+            # Children are created while the frame is unmapped, so Tk lays the
+            # whole tab out once when it is gridded instead of per widget
+            tab = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+            tab.grid_columnconfigure(0, weight=1)
+            tab.grid_rowconfigure(1, weight=1)
+            build(tab)
+            self._tabs[name] = tab
+        
+        # Only the visible tab is mapped; unmap it and map the new one in the
+        # same callback so geometry is recomputed once at idle time
+        current = self._tabs.get(self._current_tab)
+        if current is not None:
+            current.grid_remove()
+        tab.grid(row=0, column=0, sticky="nsew")
+        self._current_tab = name
+    
+    def _panel(self, tab, fill):
+        """Fill the content panel of a tab, making it scrollable once it overflows
+
+        A plain CTkFrame avoids the canvas that CTkScrollableFrame wraps its
+        contents in. Grid shrinks the panel below its requested height when
+        the content does not fit, so each resize re-checks that and swaps
+        in a scrollable panel the first time it happens.
+        """
+        panel = ctk.CTkFrame(tab)
+        fill(panel)
+        panel.grid(row=1, column=0, sticky="nsew", pady=10)
+        # CTkFrame.bind targets its canvas; the frame's own <Configure> is wanted
+        tk.Misc.bind(panel, "<Configure>",
+                     partial(self._check_panel_overflow, tab, fill, panel), "+")
+    
+    def _check_panel_overflow(self, tab, fill, panel, event):
+        """Replace a plain panel whose content no longer fits with a scrollable one"""
+        # A 1-pixel height is the placeholder before the window is laid out
+        if event.height <= 1 or panel.winfo_reqheight() <= event.height:
+            return
+        panel.destroy()
+        panel = ctk.CTkScrollableFrame(tab)
+        fill(panel)
+        panel.grid(row=1, column=0, sticky="nsew", pady=10)
+    
+    def _invalidate_tab(self, name: str):
+        """Drop a cached tab whose contents depend on changed state"""
+        tab = self._tabs.pop(name, None)
+        if tab is None:
+            return
+        tab.destroy()
+        if self._current_tab == name:
+            getattr(self, f"show_{name}")()
+    
+    def _dashboard_state(self) -> tuple:
+        """The state the dashboard renders; it is rebuilt only when this changes"""
+        return (self.connected_reader, self.secure_channel_active,
+                len(self.current_domains), len(self.current_applications))
+    
+    def _refresh_dashboard(self):
+        """Rebuild the cached dashboard if the state it shows has changed"""
+        if self._dashboard_state() != self._dashboard_key:
+            self._invalidate_tab("dashboard")
     
     def show_dashboard(self):
         """Show the dashboard tab"""
-        self.clear_content()
+        self._show_tab("dashboard", self._build_dashboard)
+    
+    def _build_dashboard(self, tab):
+        """Build the dashboard tab contents"""
+        self._dashboard_key = self._dashboard_state()
         
         # Title
         title = ctk.CTkLabel(
-            self.content_frame,
+            tab,
             text="📊 Dashboard",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self.F_TITLE
         )
         title.grid(row=0, column=0, pady=20, sticky="w")
         
         # Create dashboard content
-        dashboard_frame = ctk.CTkScrollableFrame(self.content_frame)
-        dashboard_frame.grid(row=1, column=0, sticky="nsew", pady=10)
+        self._panel(tab, self._fill_dashboard)
+    
+    def _fill_dashboard(self, dashboard_frame):
+        """Fill the dashboard panel"""
         dashboard_frame.grid_columnconfigure((0, 1), weight=1)
         
         # Connection overview
@@ -207,7 +771,7 @@ class SmartcardGUI:
         ctk.CTkLabel(
             conn_frame,
             text="🔌 Connection Status",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.F_H2
         ).pack(pady=10)
         
         status_text = "Connected" if self.connected_reader else "Disconnected"
@@ -216,14 +780,14 @@ class SmartcardGUI:
         ctk.CTkLabel(
             conn_frame,
             text=f"Reader: {self.connected_reader or 'None'}",
-            font=ctk.CTkFont(size=12)
+            font=self.F_BODY
         ).pack(pady=5)
         
         ctk.CTkLabel(
             conn_frame,
             text=f"Status: {status_text}",
             text_color=status_color,
-            font=ctk.CTkFont(size=12)
+            font=self.F_BODY
         ).pack(pady=5)
         
         # Security overview
@@ -233,7 +797,7 @@ class SmartcardGUI:
         ctk.CTkLabel(
             sec_frame,
             text="🔐 Security Status",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.F_H2
         ).pack(pady=10)
         
         sec_status = "Active" if self.secure_channel_active else "Inactive"
@@ -243,7 +807,7 @@ class SmartcardGUI:
             sec_frame,
             text=f"Secure Channel: {sec_status}",
             text_color=sec_color,
-            font=ctk.CTkFont(size=12)
+            font=self.F_BODY
         ).pack(pady=5)
         
         # Card overview
@@ -253,7 +817,7 @@ class SmartcardGUI:
         ctk.CTkLabel(
             card_frame,
             text="💳 Card Information",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.F_H2
         ).pack(pady=10)
         
         info_text = f"Security Domains: {len(self.current_domains)}\n"
@@ -262,7 +826,7 @@ class SmartcardGUI:
         ctk.CTkLabel(
             card_frame,
             text=info_text,
-            font=ctk.CTkFont(size=12)
+            font=self.F_BODY
         ).pack(pady=5)
         
         # Quick actions
@@ -272,7 +836,7 @@ class SmartcardGUI:
         ctk.CTkLabel(
             actions_frame,
             text="⚡ Quick Actions",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.F_H2
         ).pack(pady=10)
         
         actions_button_frame = ctk.CTkFrame(actions_frame)
@@ -298,18 +862,20 @@ class SmartcardGUI:
     
     def show_connection(self):
         """Show the connection tab"""
-        self.clear_content()
-        
+        self._show_tab("connection", self._build_connection)
+    
+    def _build_connection(self, tab):
+        """Build the connection tab contents"""
         # Title
         title = ctk.CTkLabel(
-            self.content_frame,
+            tab,
             text="🔌 Connection Management",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self.F_TITLE
         )
         title.grid(row=0, column=0, pady=20, sticky="w")
         
         # Connection content
-        conn_frame = ctk.CTkFrame(self.content_frame)
+        conn_frame = ctk.CTkFrame(tab)
         conn_frame.grid(row=1, column=0, sticky="nsew", pady=10)
         conn_frame.grid_columnconfigure(0, weight=1)
         
@@ -321,7 +887,7 @@ class SmartcardGUI:
         ctk.CTkLabel(
             reader_frame,
             text="PC/SC Reader:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self.F_LABEL
         ).grid(row=0, column=0, padx=10, pady=10, sticky="w")
         
         self.reader_var = ctk.StringVar()
@@ -373,18 +939,20 @@ class SmartcardGUI:
     
     def show_secure_channel(self):
         """Show the secure channel tab"""
-        self.clear_content()
-        
+        self._show_tab("secure_channel", self._build_secure_channel)
+    
+    def _build_secure_channel(self, tab):
+        """Build the secure channel tab contents"""
         # Title
         title = ctk.CTkLabel(
-            self.content_frame,
+            tab,
             text="🔐 Secure Channel Management",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self.F_TITLE
         )
         title.grid(row=0, column=0, pady=20, sticky="w")
         
         # Secure channel content
-        sc_frame = ctk.CTkFrame(self.content_frame)
+        sc_frame = ctk.CTkFrame(tab)
         sc_frame.grid(row=1, column=0, sticky="nsew", pady=10)
         sc_frame.grid_columnconfigure(0, weight=1)
         
@@ -396,11 +964,11 @@ class SmartcardGUI:
         ctk.CTkLabel(
             keyset_frame,
             text="Keyset:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self.F_LABEL
         ).grid(row=0, column=0, padx=10, pady=10, sticky="w")
         
         self.keyset_var = ctk.StringVar()
-        keysets = self.config_manager.list_keysets()
+        keysets = self._keysets()
         self.keyset_dropdown = ctk.CTkComboBox(
             keyset_frame,
             variable=self.keyset_var,
@@ -414,15 +982,14 @@ class SmartcardGUI:
         ctk.CTkLabel(
             keyset_frame,
             text="Security Level:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=self.F_LABEL
         ).grid(row=1, column=0, padx=10, pady=10, sticky="w")
         
         self.security_level_var = ctk.StringVar(value="3")
-        security_levels = ["1 (MAC)", "2 (MAC+ENC)", "3 (MAC+ENC+RMAC)"]
         self.security_level_dropdown = ctk.CTkComboBox(
             keyset_frame,
             variable=self.security_level_var,
-            values=security_levels,
+            values=self.SECURITY_LEVELS,
             state="readonly",
             width=200
         )
@@ -457,18 +1024,20 @@ class SmartcardGUI:
     
     def show_security_domains(self):
         """Show the security domains tab"""
-        self.clear_content()
-        
+        self._show_tab("security_domains", self._build_security_domains)
+    
+    def _build_security_domains(self, tab):
+        """Build the security domains tab contents"""
         # Title
         title = ctk.CTkLabel(
-            self.content_frame,
+            tab,
             text="🏢 Security Domains",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self.F_TITLE
         )
         title.grid(row=0, column=0, pady=20, sticky="w")
         
         # Security domains content
-        sd_frame = ctk.CTkFrame(self.content_frame)
+        sd_frame = ctk.CTkFrame(tab)
         sd_frame.grid(row=1, column=0, sticky="nsew", pady=10)
         sd_frame.grid_columnconfigure(0, weight=1)
         sd_frame.grid_rowconfigure(1, weight=1)
@@ -498,18 +1067,20 @@ class SmartcardGUI:
     
     def show_applications(self):
         """Show the applications tab"""
-        self.clear_content()
-        
+        self._show_tab("applications", self._build_applications)
+    
+    def _build_applications(self, tab):
+        """Build the applications tab contents"""
         # Title
         title = ctk.CTkLabel(
-            self.content_frame,
+            tab,
             text="📱 Applications",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self.F_TITLE
         )
         title.grid(row=0, column=0, pady=20, sticky="w")
         
         # Applications content
-        app_frame = ctk.CTkFrame(self.content_frame)
+        app_frame = ctk.CTkFrame(tab)
         app_frame.grid(row=1, column=0, sticky="nsew", pady=10)
         app_frame.grid_columnconfigure(0, weight=1)
         app_frame.grid_rowconfigure(1, weight=1)
@@ -533,18 +1104,20 @@ class SmartcardGUI:
     
     def show_operations(self):
         """Show the operations tab"""
-        self.clear_content()
-        
+        self._show_tab("operations", self._build_operations)
+    
+    def _build_operations(self, tab):
+        """Build the operations tab contents"""
         # Title
         title = ctk.CTkLabel(
-            self.content_frame,
+            tab,
             text="⚙️ Operations",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self.F_TITLE
         )
         title.grid(row=0, column=0, pady=20, sticky="w")
         
         # Operations content
-        ops_frame = ctk.CTkScrollableFrame(self.content_frame)
+        ops_frame = ctk.CTkScrollableFrame(tab)
         ops_frame.grid(row=1, column=0, sticky="nsew", pady=10)
         ops_frame.grid_columnconfigure((0, 1), weight=1)
         
@@ -555,7 +1128,7 @@ class SmartcardGUI:
         ctk.CTkLabel(
             clfdb_frame,
             text="🔄 CLFDB Operations",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.F_H2
         ).pack(pady=10)
         
         # AID input
@@ -575,7 +1148,7 @@ class SmartcardGUI:
         ctk.CTkComboBox(
             op_frame,
             variable=self.clfdb_op_var,
-            values=["lock", "unlock", "terminate"],
+            values=self.CLFDB_OPS,
             state="readonly"
         ).pack(side="right", padx=5)
         
@@ -592,7 +1165,7 @@ class SmartcardGUI:
         ctk.CTkLabel(
             extradite_frame,
             text="↔️ Extradition",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.F_H2
         ).pack(pady=10)
         
         # Object AID
@@ -619,18 +1192,20 @@ class SmartcardGUI:
     
     def show_visualization(self):
         """Show the visualization tab"""
-        self.clear_content()
-        
+        self._show_tab("visualization", self._build_visualization)
+    
+    def _build_visualization(self, tab):
+        """Build the visualization tab contents"""
         # Title
         title = ctk.CTkLabel(
-            self.content_frame,
+            tab,
             text="📊 Visualization",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self.F_TITLE
         )
         title.grid(row=0, column=0, pady=20, sticky="w")
         
         # Visualization content
-        viz_frame = ctk.CTkFrame(self.content_frame)
+        viz_frame = ctk.CTkFrame(tab)
         viz_frame.grid(row=1, column=0, sticky="nsew", pady=10)
         viz_frame.grid_columnconfigure(0, weight=1)
         
@@ -641,7 +1216,7 @@ class SmartcardGUI:
         ctk.CTkLabel(
             options_frame,
             text="📈 Generate Visualizations",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.F_H2
         ).pack(pady=10)
         
         # Output directory
@@ -655,6 +1230,8 @@ class SmartcardGUI:
             width=300
         )
         self.viz_dir_entry.pack(side="left", fill="x", expand=True, padx=5)
+        # Re-check the directory on the next job once the user has edited it
+        self.viz_dir_entry.bind("<FocusOut>", lambda e: self._forget_viz_dir())
         
         ctk.CTkButton(
             dir_frame,
@@ -697,19 +1274,23 @@ class SmartcardGUI:
     
     def show_settings(self):
         """Show the settings tab"""
-        self.clear_content()
-        
+        self._show_tab("settings", self._build_settings)
+    
+    def _build_settings(self, tab):
+        """Build the settings tab contents"""
         # Title
         title = ctk.CTkLabel(
-            self.content_frame,
+            tab,
             text="🔧 Settings",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self.F_TITLE
         )
         title.grid(row=0, column=0, pady=20, sticky="w")
         
         # Settings content
-        settings_frame = ctk.CTkScrollableFrame(self.content_frame)
-        settings_frame.grid(row=1, column=0, sticky="nsew", pady=10)
+        self._panel(tab, self._fill_settings)
+    
+    def _fill_settings(self, settings_frame):
+        """Fill the settings panel"""
         settings_frame.grid_columnconfigure(0, weight=1)
         
         # Appearance settings
@@ -719,7 +1300,7 @@ class SmartcardGUI:
         ctk.CTkLabel(
             appearance_frame,
             text="🎨 Appearance",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.F_H2
         ).pack(pady=10)
         
         # Theme selection
@@ -731,10 +1312,24 @@ class SmartcardGUI:
         ctk.CTkComboBox(
             theme_frame,
             variable=self.theme_var,
-            values=["dark", "light", "system"],
+            values=self.THEMES,
             command=self.change_theme
         ).pack(side="right", padx=5)
         
+        # DPI scaling
+        dpi_frame = ctk.CTkFrame(appearance_frame)
+        dpi_frame.pack(pady=5, fill="x", padx=20)
+        
+        self.automatic_dpi_var = ctk.BooleanVar(
+            value=self.config_manager.get_gui_config().automatic_dpi
+        )
+        ctk.CTkCheckBox(
+            dpi_frame,
+            text="Automatic DPI scaling (applies after restart)",
+            variable=self.automatic_dpi_var,
+            command=self.change_automatic_dpi
+        ).pack(side="left", padx=5)
+        
         # Logging settings
         logging_frame = ctk.CTkFrame(settings_frame)
         logging_frame.grid(row=1, column=0, padx=20, pady=10, sticky="ew")
@@ -742,7 +1337,7 @@ class SmartcardGUI:
         ctk.CTkLabel(
             logging_frame,
             text="📝 Logging",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.F_H2
         ).pack(pady=10)
         
         # Debug mode
@@ -763,7 +1358,7 @@ class SmartcardGUI:
         ctk.CTkLabel(
             about_frame,
             text="ℹ️ About",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.F_H2
         ).pack(pady=10)
         
         about_text = """Smartcard Management Tool v1.0.0
@@ -781,24 +1376,26 @@ Built with CustomTkinter and Python."""
         ctk.CTkLabel(
             about_frame,
             text=about_text,
-            font=ctk.CTkFont(size=11),
+            font=self.F_SMALL,
             justify="left"
         ).pack(pady=10, padx=20)
     
     def show_keysets(self):
         """Show the keyset management tab"""
-        self.clear_content()
-        
+        self._show_tab("keysets", self._build_keysets)
+    
+    def _build_keysets(self, tab):
+        """Build the keyset management tab contents"""
         # Title
         title = ctk.CTkLabel(
-            self.content_frame,
+            tab,
             text="🔑 Keyset Management",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self.F_TITLE
         )
         title.grid(row=0, column=0, pady=20, sticky="w")
         
         # Main keyset frame
-        keyset_frame = ctk.CTkFrame(self.content_frame)
+        keyset_frame = ctk.CTkFrame(tab)
         keyset_frame.grid(row=1, column=0, sticky="nsew", pady=10)
         keyset_frame.grid_columnconfigure(0, weight=1)
         keyset_frame.grid_rowconfigure(1, weight=1)
@@ -840,13 +1437,14 @@ Built with CustomTkinter and Python."""
         value_set_frame.pack(side="right", padx=10)
         
         ctk.CTkLabel(value_set_frame, text="Value Set:").pack(side="left", padx=5)
-        self.value_set_var = ctk.StringVar(value="production")
-        value_sets = self.config_manager.get_value_sets()
+        self.value_set_var = ctk.StringVar(value=self._cached_value_set)
+        self.value_set_var.trace_add("write", lambda *_: self._on_value_set_change())
+        value_sets = self._value_sets()
         self.value_set_combo = ctk.CTkComboBox(
             value_set_frame,
             variable=self.value_set_var,
             values=value_sets,
-            command=self.refresh_keysets,
+            command=self._schedule_keyset_refresh,
             width=150
         )
         self.value_set_combo.pack(side="left", padx=5)
@@ -858,19 +1456,13 @@ Built with CustomTkinter and Python."""
         table_frame.grid_rowconfigure(0, weight=1)
         
         # Create treeview for keysets
-        columns = ("Name", "Version", "ENC", "MAC", "KEK", "Protocol", "Description")
-        self.keyset_tree = ttk.Treeview(table_frame, columns=columns, show="headings", height=15)
+        self.keyset_tree = _make_tree(table_frame, self.KEYSET_COLUMNS, show="headings", height=15)
         
-        # Configure columns
-        column_widths = {"Name": 120, "Version": 80, "ENC": 100, "MAC": 100, "KEK": 100, "Protocol": 80, "Description": 200}
-        for col in columns:
-            self.keyset_tree.heading(col, text=col)
-            self.keyset_tree.column(col, width=column_widths.get(col, 100))
-        
-        # Add scrollbars
-        v_scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.keyset_tree.yview)
+        # Add scrollbars; the vertical one scrolls the virtual row window
+        v_scrollbar = ttk.Scrollbar(table_frame, orient="vertical")
         h_scrollbar = ttk.Scrollbar(table_frame, orient="horizontal", command=self.keyset_tree.xview)
-        self.keyset_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.keyset_tree.configure(xscrollcommand=h_scrollbar.set)
+        self.keyset_view = _VirtualTree(self.keyset_tree, v_scrollbar)
         
         # Grid the treeview and scrollbars
         self.keyset_tree.grid(row=0, column=0, sticky="nsew")
@@ -885,18 +1477,20 @@ Built with CustomTkinter and Python."""
     
     def show_ota(self):
         """Show the OTA management tab"""
-        self.clear_content()
-        
+        self._show_tab("ota", self._build_ota)
+    
+    def _build_ota(self, tab):
+        """Build the OTA management tab contents"""
         # Title
         title = ctk.CTkLabel(
-            self.content_frame,
+            tab,
             text="📡 OTA Management",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=self.F_TITLE
         )
         title.grid(row=0, column=0, pady=20, sticky="w")
         
         # Main OTA frame
-        ota_frame = ctk.CTkScrollableFrame(self.content_frame)
+        ota_frame = ctk.CTkScrollableFrame(tab)
         ota_frame.grid(row=1, column=0, sticky="nsew", pady=10)
         ota_frame.grid_columnconfigure((0, 1), weight=1)
         
@@ -908,7 +1502,7 @@ Built with CustomTkinter and Python."""
         ctk.CTkLabel(
             clfdb_frame,
             text="🔒 CLFDB Operations",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.F_H2
         ).grid(row=0, column=0, columnspan=2, pady=10)
         
         # AID input
@@ -943,7 +1537,7 @@ Built with CustomTkinter and Python."""
         ctk.CTkLabel(
             custom_frame,
             text="🛠️ Custom OTA",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.F_H2
         ).grid(row=0, column=0, columnspan=2, pady=10)
         
         # APDU input
@@ -966,19 +1560,25 @@ Built with CustomTkinter and Python."""
         ctk.CTkLabel(
             config_frame,
             text="⚙️ OTA Configuration",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.F_H2
         ).grid(row=0, column=0, columnspan=4, pady=10)
         
         # Keyset selection
         ctk.CTkLabel(config_frame, text="Keyset:").grid(row=1, column=0, padx=10, pady=5, sticky="w")
         self.ota_keyset_var = ctk.StringVar()
+        self._ota_keysets_loaded = False
         self.ota_keyset_combo = ctk.CTkComboBox(
             config_frame,
             variable=self.ota_keyset_var,
-            values=self.get_keyset_names(),
+            values=[self.ota_keyset_var.get()],
             width=200
         )
         self.ota_keyset_combo.grid(row=1, column=1, padx=10, pady=5, sticky="ew")
+        # Names are loaded when the pointer or focus first reaches the combo box,
+        # which is before its dropdown can be opened. CTkComboBox.bind only
+        # covers the entry, so <Enter> goes on the outer frame to include the arrow.
+        tk.Misc.bind(self.ota_keyset_combo, "<Enter>", self._populate_ota_keysets, "+")
+        self.ota_keyset_combo.bind("<FocusIn>", self._populate_ota_keysets)
         
         # SPI (Security Parameter Index)
         ctk.CTkLabel(config_frame, text="SPI:").grid(row=1, column=2, padx=10, pady=5, sticky="w")
@@ -993,10 +1593,10 @@ Built with CustomTkinter and Python."""
         ctk.CTkLabel(
             results_frame,
             text="📋 OTA Results",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.F_H2
         ).grid(row=0, column=0, pady=10, sticky="w")
         
-        self.ota_results = ctk.CTkTextbox(results_frame, height=200)
+        self.ota_results = ctk.CTkTextbox(results_frame, height=200, state="disabled")
         self.ota_results.grid(row=1, column=0, padx=10, pady=10, sticky="ew")
         
         # Message history section
@@ -1007,7 +1607,7 @@ Built with CustomTkinter and Python."""
         ctk.CTkLabel(
             history_frame,
             text="📚 Message History",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=self.F_H2
         ).grid(row=0, column=0, pady=10, sticky="w")
         
         # History controls
@@ -1033,14 +1633,9 @@ Built with CustomTkinter and Python."""
         history_table_frame.grid(row=2, column=0, padx=10, pady=10, sticky="ew")
         history_table_frame.grid_columnconfigure(0, weight=1)
         
-        history_columns = ("Timestamp", "Type", "AID", "Status", "Message")
-        self.ota_history_tree = ttk.Treeview(history_table_frame, columns=history_columns, show="headings", height=8)
-        
-        # Configure history columns
-        history_widths = {"Timestamp": 150, "Type": 100, "AID": 150, "Status": 80, "Message": 300}
-        for col in history_columns:
-            self.ota_history_tree.heading(col, text=col)
-            self.ota_history_tree.column(col, width=history_widths.get(col, 100))
+        self.ota_history_tree = _make_tree(history_table_frame, self.OTA_HISTORY_COLUMNS,
+                                           show="headings", height=8)
+        self._ota_rows_shown.clear()
         
         # History scrollbar
         history_scrollbar = ttk.Scrollbar(history_table_frame, orient="vertical", command=self.ota_history_tree.yview)
@@ -1052,123 +1647,182 @@ Built with CustomTkinter and Python."""
         # Load initial data
         self.refresh_ota_history()    # Keyset management methods
     
+    def _keysets(self) -> List[str]:
+        """Configured keyset names, loaded once until keysets change"""
+        if self._keysets_cache is None:
+            self._keysets_cache = self.config_manager.list_keysets()
+        return self._keysets_cache
+    
+    def _value_sets(self) -> List[str]:
+        """Value set names from the database, loaded once until keysets change"""
+        if self._value_sets_cache is None:
+            self._value_sets_cache = self.config_manager.get_value_sets()
+        return self._value_sets_cache
+    
+    def _invalidate_keyset_caches(self):
+        """Forget cached keyset/value set names after a keyset change"""
+        self._keysets_cache = None
+        self._value_sets_cache = None
+        self._keysets_by_name.clear()
+    
     def refresh_keysets(self):
-        """Refresh the keyset table with current data"""
-        try:
-            # Clear existing items
-            for item in self.keyset_tree.get_children():
-                self.keyset_tree.delete(item)
-            
-            # Get current value set
-            value_set = self.value_set_var.get()
-            
-            # Load keysets from database
+        """Refresh the keyset table with current data, querying the database in the background"""
+        # Get current value set
+        value_set = self.current_value_set
+        
+        # Load keysets from database and format their rows on the worker
+        def load():
             keysets = self.db_manager.get_keysets(value_set=value_set)
+            return keysets, [_keyset_row(keyset) for keyset in keysets]
+        
+        self.run_bg(load, partial(self._apply_keysets, value_set=value_set), pool=self._db_pool)
+    
+    @property
+    def current_value_set(self) -> str:
+        """The selected keyset value set ("production" until the keysets tab is built)"""
+        return self._cached_value_set
+    
+    def _on_value_set_change(self):
+        """Track writes to value_set_var"""
+        self._cached_value_set = self.value_set_var.get()
+        # A keyset chosen from the old value set does not apply to the new one
+        if hasattr(self, 'ota_keyset_var'):
+            self.ota_keyset_var.set("")
+            self._ota_keysets_loaded = False
+    
+    def _schedule_keyset_refresh(self, *_):
+        """Refresh keysets 150 ms after the last value set change, coalescing bursts"""
+        if self._keyset_refresh_after_id is not None:
+            self.root.after_cancel(self._keyset_refresh_after_id)
+        self._keyset_refresh_after_id = self.root.after(150, self._do_refresh_keysets)
+    
+    def _do_refresh_keysets(self):
+        """Run the debounced keyset refresh"""
+        self._keyset_refresh_after_id = None
+        self.refresh_keysets()
+    
+    def _apply_keysets(self, future, value_set: str):
+        """Show keysets loaded by refresh_keysets (UI thread)"""
+        try:
+            keysets, rows = future.result()
             
-            # Populate table
-            for keyset in keysets:
-                values = (
-                    keyset.name,
-                    keyset.key_version,
-                    keyset.enc_key[:16] + "..." if len(keyset.enc_key) > 16 else keyset.enc_key,
-                    keyset.mac_key[:16] + "..." if len(keyset.mac_key) > 16 else keyset.mac_key,
-                    keyset.dek_key[:16] + "..." if len(keyset.dek_key) > 16 else keyset.dek_key,
-                    keyset.protocol,
-                    keyset.description or ""
-                )
-                self.keyset_tree.insert("", "end", values=values, tags=(keyset.name,))
+            # Rows were formatted once on load; only the visible ones are inserted.
+            # Names are unique within a value set and the rows are sorted by name
+            self._all_keysets = keysets
+            self._keysets_by_name = {(keyset.name, value_set): keyset for keyset in keysets}
+            self.keyset_view.set_rows((values[0], values) for values in rows)
             
             self.update_status(f"Loaded {len(keysets)} keysets from {value_set} value set")
             
+            # Keep the cached OTA tab's keyset list in step
+            if hasattr(self, 'ota_keyset_combo') and value_set == self.current_value_set:
+                self.ota_keyset_combo.configure(values=[keyset.name for keyset in keysets])
+                self._ota_keysets_loaded = True
+            
         except Exception as e:
             messagebox.showerror("Error", f"Failed to refresh keysets: {e}")
     
     def show_add_keyset_dialog(self):
         """Show dialog to add a new keyset"""
         dialog = KeysetDialog(self.root, "Add Keyset")
-        if dialog.result:
-            try:
-                keyset_data = dialog.result
-                value_set = self.value_set_var.get()
-                
-                # Create keyset record
-                keyset = KeysetRecord(
-                    id=None,
-                    name=keyset_data['name'],
-                    value_set=value_set,
-                    protocol=keyset_data.get('protocol', 'SCP02'),
-                    enc_key=keyset_data['enc_key'],
-                    mac_key=keyset_data['mac_key'],
-                    dek_key=keyset_data['dek_key'],
-                    key_version=keyset_data.get('key_version', 1),
-                    security_level=keyset_data.get('security_level', 3),
-                    description=keyset_data.get('description', ''),
-                    created_at="",
-                    updated_at="",
-                    is_active=True
-                )
-                
-                # Add to database
-                self.db_manager.add_keyset(keyset)
-                self.refresh_keysets()
-                messagebox.showinfo("Success", f"Keyset '{keyset_data['name']}' added successfully")
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to add keyset: {e}")
+        dialog.future.add_done_callback(self._add_keyset_done)
+    
+    def _add_keyset_done(self, future: Future):
+        """Store a keyset entered in the add dialog (UI thread)"""
+        keyset_data = future.result()
+        if not keyset_data:
+            return
+        try:
+            value_set = self.current_value_set
+            
+            # Create keyset record
+            from src.database_manager import KeysetRecord
+            keyset = KeysetRecord(
+                id=None,
+                name=keyset_data['name'],
+                value_set=value_set,
+                protocol=keyset_data.get('protocol', 'SCP02'),
+                enc_key=keyset_data['enc_key'],
+                mac_key=keyset_data['mac_key'],
+                dek_key=keyset_data['dek_key'],
+                key_version=keyset_data.get('key_version', 1),
+                security_level=keyset_data.get('security_level', 3),
+                description=keyset_data.get('description', ''),
+                created_at="",
+                updated_at="",
+                is_active=True
+            )
+            
+            # Add to database
+            self.db_manager.add_keyset(keyset)
+            self._invalidate_keyset_caches()
+            self.refresh_keysets()
+            messagebox.showinfo("Success", f"Keyset '{keyset_data['name']}' added successfully")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to add keyset: {e}")
     
     def edit_selected_keyset(self):
         """Edit the selected keyset"""
-        selection = self.keyset_tree.selection()
-        if not selection:
+        # Row iids are keyset names; the selection survives scrolling out of view
+        keyset_name = self.keyset_view.selected
+        if keyset_name is None:
             messagebox.showwarning("Warning", "Please select a keyset to edit")
             return
         
         try:
-            item = selection[0]
-            keyset_name = self.keyset_tree.item(item)['values'][0]
-            value_set = self.value_set_var.get()
+            value_set = self.current_value_set
             
-            # Get keyset from database
-            keyset = self.db_manager.get_keyset_by_name(keyset_name, value_set)
+            # Get keyset from the loaded table, or the database on a miss
+            keyset = self._find_keyset(keyset_name, value_set)
             if not keyset:
                 messagebox.showerror("Error", "Keyset not found")
                 return
             
             # Show edit dialog
             dialog = KeysetDialog(self.root, "Edit Keyset", keyset)
-            if dialog.result:
-                keyset_data = dialog.result
-                
-                # Update keyset fields
-                keyset.name = keyset_data['name']
-                keyset.protocol = keyset_data.get('protocol', keyset.protocol)
-                keyset.enc_key = keyset_data['enc_key']
-                keyset.mac_key = keyset_data['mac_key']
-                keyset.dek_key = keyset_data['dek_key']
-                keyset.key_version = keyset_data.get('key_version', keyset.key_version)
-                keyset.security_level = keyset_data.get('security_level', keyset.security_level)
-                keyset.description = keyset_data.get('description', keyset.description)
-                
-                self.db_manager.update_keyset(keyset)
-                self.refresh_keysets()
-                messagebox.showinfo("Success", f"Keyset '{keyset_data['name']}' updated successfully")
-                
+            dialog.future.add_done_callback(partial(self._edit_keyset_done, keyset))
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to edit keyset: {e}")
+    
+    def _edit_keyset_done(self, keyset, future: Future):
+        """Store the changes made to keyset in the edit dialog (UI thread)"""
+        keyset_data = future.result()
+        if not keyset_data:
+            return
+        try:
+            # Update keyset fields
+            keyset.name = keyset_data['name']
+            keyset.protocol = keyset_data.get('protocol', keyset.protocol)
+            keyset.enc_key = keyset_data['enc_key']
+            keyset.mac_key = keyset_data['mac_key']
+            keyset.dek_key = keyset_data['dek_key']
+            keyset.key_version = keyset_data.get('key_version', keyset.key_version)
+            keyset.security_level = keyset_data.get('security_level', keyset.security_level)
+            keyset.description = keyset_data.get('description', keyset.description)
+            
+            self.db_manager.update_keyset(keyset)
+            self._invalidate_keyset_caches()
+            self.refresh_keysets()
+            messagebox.showinfo("Success", f"Keyset '{keyset_data['name']}' updated successfully")
+            
         except Exception as e:
             messagebox.showerror("Error", f"Failed to edit keyset: {e}")
     
     def delete_selected_keyset(self):
         """Delete the selected keyset"""
-        selection = self.keyset_tree.selection()
-        if not selection:
+        # Row iids are keyset names; the selection survives scrolling out of view
+        keyset_name = self.keyset_view.selected
+        if keyset_name is None:
             messagebox.showwarning("Warning", "Please select a keyset to delete")
             return
         
         try:
-            item = selection[0]
-            keyset_name = self.keyset_tree.item(item)['values'][0]
-            value_set = self.value_set_var.get()
-              # Get keyset to find its ID
-            keyset = self.db_manager.get_keyset_by_name(keyset_name, value_set)
+            value_set = self.current_value_set
+            
+            # Get keyset to find its ID
+            keyset = self._find_keyset(keyset_name, value_set)
             if not keyset or keyset.id is None:
                 messagebox.showerror("Error", "Keyset not found")
                 return
@@ -1178,6 +1832,7 @@ Built with CustomTkinter and Python."""
                 return
             
             self.db_manager.delete_keyset(keyset.id)
+            self._invalidate_keyset_caches()
             self.refresh_keysets()
             messagebox.showinfo("Success", f"Keyset '{keyset_name}' deleted successfully")
             
@@ -1187,15 +1842,28 @@ Built with CustomTkinter and Python."""
     def get_keyset_names(self):
         """Get list of keyset names for dropdown"""
         try:
-            value_set = getattr(self, 'value_set_var', None)
-            current_set = value_set.get() if value_set else "production"
-            keysets = self.db_manager.get_keysets(value_set=current_set)
-            return [keyset.name for keyset in keysets]
+            return self.db_manager.get_keyset_names(self.current_value_set)
         except:
             return ["No keysets available"]
     
     # OTA management methods
     
+    def _find_keyset(self, name: str, value_set: str):
+        """Look up a keyset record from the last table load, querying the database on a miss"""
+        keyset = self._keysets_by_name.get((name, value_set))
+        if keyset is None:
+            keyset = self.db_manager.get_keyset_by_name(name, value_set)
+            if keyset is not None:
+                self._keysets_by_name[(name, value_set)] = keyset
+        return keyset
+    
+    def _populate_ota_keysets(self, event=None):
+        """Fill the OTA keyset combo box the first time it is about to be used"""
+        if self._ota_keysets_loaded:
+            return
+        self.ota_keyset_combo.configure(values=self.get_keyset_names())
+        self._ota_keysets_loaded = True
+    
     def execute_clfdb_operation(self, operation: str):
         """Execute a CLFDB operation"""
         aid = self.ota_aid_entry.get().strip()
@@ -1205,9 +1873,8 @@ Built with CustomTkinter and Python."""
         
         try:
             # Validate AID format
-            aid_bytes = bytes.fromhex(aid.replace(' ', ''))
-            if len(aid_bytes) < 5 or len(aid_bytes) > 16:
-                messagebox.showerror("Error", "AID must be 5-16 bytes")
+            if _parse_hex(aid, 5, 16) is None:
+                messagebox.showerror("Error", "AID must be 5-16 bytes of hex")
                 return
             
             # Get selected keyset
@@ -1216,9 +1883,8 @@ Built with CustomTkinter and Python."""
                 messagebox.showwarning("Warning", "Please select a keyset")
                 return
             
-            value_set = getattr(self, 'value_set_var', None)
-            current_set = value_set.get() if value_set else "production"
-            keyset = self.db_manager.get_keyset_by_name(keyset_name, current_set)
+            current_set = self.current_value_set
+            keyset = self._find_keyset(keyset_name, current_set)
             if not keyset:
                 messagebox.showerror("Error", "Selected keyset not found")
                 return
@@ -1249,9 +1915,8 @@ Built with CustomTkinter and Python."""
         
         try:
             # Validate APDU format
-            apdu_bytes = bytes.fromhex(apdu.replace(' ', ''))
-            if len(apdu_bytes) < 4:
-                messagebox.showerror("Error", "APDU must be at least 4 bytes")
+            if _parse_hex(apdu, 4) is None:
+                messagebox.showerror("Error", "APDU must be at least 4 bytes of hex")
                 return
             
             # Get selected keyset
@@ -1260,9 +1925,8 @@ Built with CustomTkinter and Python."""
                 messagebox.showwarning("Warning", "Please select a keyset")
                 return
             
-            value_set = getattr(self, 'value_set_var', None)
-            current_set = value_set.get() if value_set else "production"
-            keyset = self.db_manager.get_keyset_by_name(keyset_name, current_set)
+            current_set = self.current_value_set
+            keyset = self._find_keyset(keyset_name, current_set)
             if not keyset:
                 messagebox.showerror("Error", "Selected keyset not found")
                 return
@@ -1285,57 +1949,54 @@ Built with CustomTkinter and Python."""
     
     def display_ota_result(self, operation: str, target: str, ota_message: str):
         """Display OTA generation results"""
-        self.ota_results.delete("1.0", "end")
-        
-        result_text = f"""✅ OTA Message Generated Successfully
-
-Operation: {operation}
-Target: {target}
-Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}
-
-SMS-PP Envelope:
-{ota_message}
-
-Message Length: {len(ota_message.replace(' ', '')) // 2} bytes
-
-Instructions:
-1. Copy the SMS-PP envelope above
-2. Send it via your OTA platform
-3. Monitor the response from the target device
-"""
-        
-        self.ota_results.insert("1.0", result_text)
+        result_text = "\n".join([
+            "✅ OTA Message Generated Successfully",
+            "",
+            f"Operation: {operation}",
+            f"Target: {target}",
+            f"Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}",
+            "",
+            "SMS-PP Envelope:",
+            ota_message,
+            "",
+            f"Message Length: {len(ota_message.replace(' ', '')) // 2} bytes",
+            "",
+            "Instructions:",
+            "1. Copy the SMS-PP envelope above",
+            "2. Send it via your OTA platform",
+            "3. Monitor the response from the target device",
+        ])
+        
+        # The pane is read-only between updates
+        self.ota_results.configure(state="normal")
+        _write_lines(self.ota_results, [result_text], replace=True)
+        self.ota_results.configure(state="disabled")
     
     def refresh_ota_history(self):
-        """Refresh the OTA message history"""
+        """Refresh the OTA message history, querying the database in the background"""
+        self.run_bg(partial(self.db_manager.get_ota_messages, limit=OTA_HISTORY_LIMIT),
+                    self._apply_ota_history, pool=self._db_pool)
+    
+    def _apply_ota_history(self, future):
+        """Show OTA messages loaded by refresh_ota_history (UI thread)"""
         try:
-            # Clear existing items
-            for item in self.ota_history_tree.get_children():
-                self.ota_history_tree.delete(item)
-            
             # Load OTA messages from database
-            messages = self.db_manager.get_ota_messages()
+            messages = future.result()
             
-            # Populate table (limit to last 100)
-            for msg in messages[:100]:
-                # Parse created_at timestamp
-                try:
-                    from datetime import datetime
-                    dt = datetime.fromisoformat(msg.created_at)
-                    timestamp_str = dt.strftime('%Y-%m-%d %H:%M:%S')
-                except:
-                    timestamp_str = msg.created_at
-                
+            # Populate table, newest first as returned
+            rows = []
+            for msg in messages:
                 values = (
-                    timestamp_str,
+                    _format_timestamp(msg.created_at),
                     msg.operation,
                     msg.target_aid[:20] + "..." if len(msg.target_aid) > 20 else msg.target_aid,
                     msg.status,
                     f"Template: {msg.template_id}"
                 )
-                self.ota_history_tree.insert("", "end", values=values)
+                rows.append((str(msg.id), values))
+            _sync_tree(self.ota_history_tree, self._ota_rows_shown, rows)
             
-            self.update_status(f"Loaded {len(messages[:100])} OTA messages from history")
+            self.update_status(f"Loaded {len(messages)} OTA messages from history")
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to refresh OTA history: {e}")
@@ -1347,8 +2008,8 @@ Instructions:
         
         try:
             # Just clear the display for now
-            for item in self.ota_history_tree.get_children():
-                self.ota_history_tree.delete(item)
+            self.ota_history_tree.delete(*self.ota_history_tree.get_children())
+            self._ota_rows_shown.clear()
             
             self.update_status("OTA history cleared")
             messagebox.showinfo("Success", "OTA history cleared successfully")
@@ -1357,33 +2018,86 @@ Instructions:
             messagebox.showerror("Error", f"Failed to clear OTA history: {e}")
       # Event handlers and utility methods
     
+    def run_bg(self, fn, on_done, pool: Optional[ThreadPoolExecutor] = None):
+        """Run fn on a worker pool (the card pool by default) and call on_done(future) on the UI thread"""
+        future = (pool or self._card_pool).submit(fn)
+        future.add_done_callback(partial(self.call_ui, on_done))
+        return future
+    
+    def call_ui(self, fn, *args):
+        """Have fn(*args) run on the UI thread; safe to call from workers"""
+        self._ui_queue.put((fn, args))
+    
+    def _drain_ui_queue(self):
+        """Run the callbacks queued by workers, polling every UI_POLL_MS
+
+        Workers never touch Tk; a single poll picks up everything they
+        queued since the last one instead of one event per result.
+        """
+        # Re-arm first so a failing callback cannot stop the polling
+        self.root.after(UI_POLL_MS, self._drain_ui_queue)
+        queue = self._ui_queue
+        while True:
+            try:
+                fn, args = queue.get_nowait()
+            except Empty:
+                return
+            fn(*args)
+    
+    def on_close(self):
+        """Shut down the worker pools and close the main window"""
+        self._card_pool.shutdown(wait=False, cancel_futures=True)
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self._db_pool.shutdown(wait=False, cancel_futures=True)
+        self._viz_pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+    
     def refresh_readers(self):
-        """Refresh the list of available readers"""
+        """Refresh the list of available readers in the background"""
+        if "readers" in self._refreshing:
+            return
+        self._refreshing.add("readers")
+        self.update_status("Scanning for PC/SC readers...")
+        self._io_pool.submit(self._bg_refresh_readers)
+    
+    def _bg_refresh_readers(self):
+        """Worker: list PC/SC readers and hand the result to the UI thread"""
         try:
-            self.update_status("Scanning for PC/SC readers...")
             readers = self.sc_manager.list_readers()
-            
-            if readers:
+        except Exception as e:
+            self.call_ui(self._readers_failed, str(e))
+        else:
+            self.call_ui(self._apply_readers, readers)
+    
+    def _apply_readers(self, readers: List[str]):
+        """Show a reader scan result (UI thread)"""
+        self._refreshing.discard("readers")
+        has_dropdown = hasattr(self, 'reader_dropdown')
+        
+        if readers:
+            if has_dropdown:
                 self.reader_dropdown.configure(values=readers)
                 if not self.reader_var.get() or self.reader_var.get() not in readers:
                     self.reader_var.set(readers[0])
-                self.update_status(f"Found {len(readers)} reader(s)")
-            else:
+            self.update_status(f"Found {len(readers)} reader(s)")
+        else:
+            if has_dropdown:
                 self.reader_dropdown.configure(values=["No readers found"])
                 self.reader_var.set("No readers found")
-                self.update_status("No PC/SC readers found")
-                
-        except Exception as e:
-            error_msg = str(e)
-            print(f"Debug: Reader scan error - {error_msg}")  # Debug output
-            messagebox.showerror("PC/SC Error", 
-                f"PC/SC Service Issue:\n\n{error_msg}\n\n" +
-                "Please check:\n" +
-                "• PC/SC service is running\n" +
-                "• Smart card reader is connected\n" +
-                "• Reader drivers are installed\n" +
-                "• No other applications are using the reader")
-            self.update_status("PC/SC Error - Check reader connection")
+            self.update_status("No PC/SC readers found")
+    
+    def _readers_failed(self, error_msg: str):
+        """Report a reader scan failure (UI thread)"""
+        self._refreshing.discard("readers")
+        print(f"Debug: Reader scan error - {error_msg}")  # Debug output
+        messagebox.showerror("PC/SC Error", 
+            f"PC/SC Service Issue:\n\n{error_msg}\n\n" +
+            "Please check:\n" +
+            "• PC/SC service is running\n" +
+            "• Smart card reader is connected\n" +
+            "• Reader drivers are installed\n" +
+            "• No other applications are using the reader")
+        self.update_status("PC/SC Error - Check reader connection")
     
     def connect_to_reader(self):
         """Connect to the selected reader"""
@@ -1392,36 +2106,51 @@ Instructions:
             messagebox.showwarning("Warning", "Please select a valid reader")
             return
         
+        self.update_status(f"Connecting to {reader_name}...")
+        self.connect_btn.configure(state="disabled")
+        self.run_bg(partial(self._bg_connect, reader_name), partial(self._connect_done, reader_name))
+    
+    def _bg_connect(self, reader_name: str) -> Optional[tuple]:
+        """Worker: connect, select the Card Manager and read the ATR
+
+        Returns None if the connection failed, else (selected, ATR line).
+        """
+        if not self.sc_manager.connect_to_reader(reader_name):
+            return None
+        if not self.gp_manager.select_card_manager():
+            return False, None
+        # Get ATR safely
         try:
-            self.update_status(f"Connecting to {reader_name}...")
-            
-            if self.sc_manager.connect_to_reader(reader_name):
+            if self.sc_manager.active_reader:
+                atr_line = f"ATR: {_hex(self.sc_manager.active_reader.get_atr())}"
+            else:
+                atr_line = "ATR: Not available (no active reader)"
+        except Exception as atr_error:
+            atr_line = f"ATR: Error reading - {atr_error}"
+        return True, atr_line
+    
+    def _connect_done(self, reader_name: str, future: Future):
+        """Show the result of connect_to_reader (UI thread)"""
+        try:
+            result = future.result()
+            if result is not None:
+                selected, atr_line = result
                 self.connected_reader = reader_name
-                self.connect_btn.configure(state="disabled")
                 self.disconnect_btn.configure(state="normal")
                 self.update_connection_status()
                 
-                # Try to select Card Manager
-                if self.gp_manager.select_card_manager():
-                    self.connection_info.insert("end", f"✅ Connected to {reader_name}\n")
-                    self.connection_info.insert("end", f"✅ Card Manager selected\n")
+                if selected:
+                    _write_lines(self.connection_info, [f"✅ Connected to {reader_name}",
+                                                        "✅ Card Manager selected", atr_line])
                     self.update_status("Connected successfully")
-                      # Get ATR safely
-                    try:
-                        if self.sc_manager.active_reader:
-                            atr = self.sc_manager.active_reader.get_atr()
-                            self.connection_info.insert("end", f"ATR: {toHexString(atr)}\n")
-                        else:
-                            self.connection_info.insert("end", "ATR: Not available (no active reader)\n")
-                    except Exception as atr_error:
-                        self.connection_info.insert("end", f"ATR: Error reading - {atr_error}\n")
-                      # Refresh card data
+                    # Refresh card data
                     self.refresh_card_data()
                 else:
-                    self.connection_info.insert("end", f"✅ Connected to {reader_name}\n")
-                    self.connection_info.insert("end", f"⚠️ Could not select Card Manager\n")
+                    _write_lines(self.connection_info, [f"✅ Connected to {reader_name}",
+                                                        "⚠️ Could not select Card Manager"])
                     self.update_status("Connected, but Card Manager not available")
             else:
+                self.connect_btn.configure(state="normal")
                 error_msg = "Failed to connect to reader"
                 messagebox.showerror("Connection Error", 
                     f"Connection Failed:\n\n{error_msg}\n\n" +
@@ -1433,6 +2162,7 @@ Instructions:
                 self.update_status("Connection failed - Check card and reader")
                 
         except Exception as e:
+            self.connect_btn.configure(state="normal")
             error_msg = str(e)
             print(f"Debug: Connection error - {error_msg}")  # Debug output
             messagebox.showerror("Connection Error", 
@@ -1449,7 +2179,14 @@ Instructions:
                 self.secure_channel.close_secure_channel()
                 self.secure_channel_active = False
             
-            self.sc_manager.disconnect_all()
+            # A refresh that has not started yet would only fail on the closed card
+            if self._card_refresh_future is not None:
+                self._card_refresh_future.cancel()
+            self._card_refresh_pending = False
+            self._card_snapshot = None
+            
+            # Queued behind any card job still running on the handle
+            self.run_bg(self.sc_manager.disconnect_all, self._disconnect_done)
             self.connected_reader = None
             
             # Safely update button states if they exist
@@ -1464,12 +2201,18 @@ Instructions:
             
             self.update_connection_status()
             if hasattr(self, 'connection_info'):
-                self.connection_info.insert("end", "🔌 Disconnected from all readers\n")
+                _write_lines(self.connection_info, ["🔌 Disconnected from all readers"])
             self.update_status("Disconnected")
             
         except Exception as e:
             messagebox.showerror("Error", f"Disconnect error: {e}")
     
+    def _disconnect_done(self, future: Future):
+        """Report a failed disconnect (UI thread)"""
+        error = future.exception()
+        if error is not None:
+            messagebox.showerror("Error", f"Disconnect error: {error}")
+    
     def establish_secure_channel(self):
         """Establish secure channel"""
         if not self.connected_reader:
@@ -1493,7 +2236,20 @@ Instructions:
             
             self.update_status(f"Establishing {keyset.protocol} secure channel...")
             
-            if self.secure_channel.establish_secure_channel(keyset, security_level):
+        except Exception as e:
+            messagebox.showerror("Error", f"Secure channel error: {e}")
+            self.update_status("Secure channel error")
+            return
+        
+        self.run_bg(
+            partial(self.secure_channel.establish_secure_channel, keyset, security_level),
+            partial(self._secure_channel_done, keyset=keyset, security_level=security_level)
+        )
+    
+    def _secure_channel_done(self, future, keyset, security_level: int):
+        """Apply the result of establishing a secure channel (UI thread)"""
+        try:
+            if future.result():
                 self.secure_channel_active = True
                 # Safely update button states if they exist
                 if hasattr(self, 'establish_btn'):
@@ -1503,9 +2259,9 @@ Instructions:
                 self.update_connection_status()
                 
                 if hasattr(self, 'sc_info'):
-                    self.sc_info.insert("end", f"✅ Secure channel established\n")
-                    self.sc_info.insert("end", f"Protocol: {keyset.protocol}\n")
-                    self.sc_info.insert("end", f"Security Level: {security_level}\n")
+                    _write_lines(self.sc_info, ["✅ Secure channel established",
+                                                f"Protocol: {keyset.protocol}",
+                                                f"Security Level: {security_level}"])
                 self.update_status("Secure channel established")
             else:
                 messagebox.showerror("Error", "Failed to establish secure channel")
@@ -1529,44 +2285,81 @@ Instructions:
             self.update_connection_status()
             
             if hasattr(self, 'sc_info'):
-                self.sc_info.insert("end", "🔒 Secure channel closed\n")
+                _write_lines(self.sc_info, ["🔒 Secure channel closed"])
             self.update_status("Secure channel closed")
             
         except Exception as e:
             messagebox.showerror("Error", f"Error closing secure channel: {e}")
     
     def refresh_card_data(self):
-        """Refresh card data (security domains and applications)"""
+        """Refresh card data (security domains and applications) in the background"""
         if not self.connected_reader:
             return
+        # At most one refresh is queued or running. Requests made meanwhile
+        # (e.g. after a CLFDB on the card) collapse into one follow-up refresh
+        if self._card_refresh_future is not None and not self._card_refresh_future.done():
+            self._card_refresh_pending = True
+            return
         
-        def refresh_thread():
-            try:
-                self.update_status("Refreshing card data...")
-                
-                # Get security domains
-                self.current_domains = self.gp_manager.list_security_domains()
-                
-                # Get applications
-                self.current_applications = self.gp_manager.list_applications()
-                
-                # Update UI on main thread
-                self.root.after(0, self.update_card_data_ui)
-                
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to refresh card data: {e}"))
-                self.root.after(0, lambda: self.update_status("Card data refresh failed"))
-        
-        threading.Thread(target=refresh_thread, daemon=True).start()
+        self.update_status("Refreshing card data...")
+        self._card_refresh_future = self.run_bg(self._bg_refresh_card_data, self._card_data_done)
+    
+    def _bg_refresh_card_data(self):
+        """Worker: read domains and applications in one card transaction
+
+        The tree rows are formatted here too, keyed by AID, so the UI thread
+        only hands finished strings to Tk.
+        """
+        with self.sc_manager.transaction():
+            domains, applications = self.gp_manager.list_all()
+        sd_rows = [_domain_row(domain) for domain in domains]
+        app_rows = [_app_row(app) for app in applications]
+        return domains, applications, sd_rows, app_rows, _card_digest(domains, applications)
+    
+    def _card_data_done(self, future: Future):
+        """Apply or report a finished card data refresh (UI thread)"""
+        if future.cancelled():
+            return
+        try:
+            result = future.result()
+        except Exception as e:
+            self._card_data_failed(str(e))
+        else:
+            self._apply_card_data(*result)
+        if self._card_refresh_pending:
+            self._card_refresh_pending = False
+            self.refresh_card_data()
+    
+    def _apply_card_data(self, domains: List['SecurityDomainInfo'],
+                         applications: List['ApplicationInfo'],
+                         sd_rows: List[tuple], app_rows: List[tuple], digest: bytes):
+        """Store refreshed card data and redraw (UI thread)"""
+        self.current_domains = domains
+        self.current_applications = applications
+        if digest == self._card_snapshot:
+            # Nothing shown has changed; leave the trees and dashboard alone
+            self.update_status(f"Card unchanged: {len(domains)} domains, {len(applications)} applications")
+            return
+        self._card_snapshot = digest
+        self._sd_display = sd_rows
+        self._app_display = app_rows
+        self.update_card_data_ui()
+    
+    def _card_data_failed(self, error_msg: str):
+        """Report a card data refresh failure (UI thread)"""
+        messagebox.showerror("Error", f"Failed to refresh card data: {error_msg}")
+        self.update_status("Card data refresh failed")
     
     def update_card_data_ui(self):
         """Update the UI with refreshed card data"""
         self.update_status(f"Found {len(self.current_domains)} domains, {len(self.current_applications)} applications")
+        self._refresh_dashboard()
         
-        # Update trees if they exist
-        if hasattr(self, 'sd_tree'):
+        # Update trees whose tab has been built; a tab that was never shown
+        # is filled from the stored rows when it is built
+        if self.sd_view is not None and self.sd_view.tree.winfo_exists():
             self.populate_security_domains_tree()
-        if hasattr(self, 'app_tree'):
+        if self.app_view is not None and self.app_view.tree.winfo_exists():
             self.populate_applications_tree()
     
     def refresh_security_domains(self):
@@ -1584,20 +2377,11 @@ Instructions:
         tree_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Create treeview
-        columns = ("AID", "Type", "Lifecycle", "Privileges")
-        self.sd_tree = ttk.Treeview(tree_frame, columns=columns, show="tree headings", height=10)
-        
-        # Configure columns
-        self.sd_tree.heading("#0", text="Name")
-        self.sd_tree.column("#0", width=100)
-        
-        for col in columns:
-            self.sd_tree.heading(col, text=col)
-            self.sd_tree.column(col, width=120)
+        self.sd_tree = _make_tree(tree_frame, self.SD_COLUMNS, show="tree headings", height=10)
         
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.sd_tree.yview)
-        self.sd_tree.configure(yscrollcommand=scrollbar.set)
+        # Add scrollbar; it scrolls the virtual row window
+        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical")
+        self.sd_view = _VirtualTree(self.sd_tree, scrollbar, label="SD {}")
         
         # Pack tree and scrollbar
         self.sd_tree.pack(side="left", fill="both", expand=True)
@@ -1608,23 +2392,8 @@ Instructions:
     
     def populate_security_domains_tree(self):
         """Populate the security domains tree with data"""
-        # Clear existing items
-        for item in self.sd_tree.get_children():
-            self.sd_tree.delete(item)
-        
-        # Add security domains
-        for i, domain in enumerate(self.current_domains):
-            self.sd_tree.insert(
-                "",
-                "end",
-                text=f"SD {i+1}",
-                values=(
-                    toHexString(domain.aid),
-                    domain.domain_type,
-                    domain.life_cycle.name,
-                    f"0x{domain.privileges:02X}"
-                )
-            )
+        # Rows are keyed by AID so a refresh only touches what changed on the card
+        self.sd_view.set_rows(self._sd_display)
     
     def create_applications_tree(self):
         """Create the applications tree view"""
@@ -1633,20 +2402,11 @@ Instructions:
         tree_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Create treeview
-        columns = ("AID", "Lifecycle", "Privileges")
-        self.app_tree = ttk.Treeview(tree_frame, columns=columns, show="tree headings", height=10)
-        
-        # Configure columns
-        self.app_tree.heading("#0", text="Name")
-        self.app_tree.column("#0", width=100)
+        self.app_tree = _make_tree(tree_frame, self.APP_COLUMNS, show="tree headings", height=10)
         
-        for col in columns:
-            self.app_tree.heading(col, text=col)
-            self.app_tree.column(col, width=150)
-        
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.app_tree.yview)
-        self.app_tree.configure(yscrollcommand=scrollbar.set)
+        # Add scrollbar; it scrolls the virtual row window
+        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical")
+        self.app_view = _VirtualTree(self.app_tree, scrollbar, label="App {}")
         
         # Pack tree and scrollbar
         self.app_tree.pack(side="left", fill="both", expand=True)
@@ -1657,22 +2417,7 @@ Instructions:
     
     def populate_applications_tree(self):
         """Populate the applications tree with data"""
-        # Clear existing items
-        for item in self.app_tree.get_children():
-            self.app_tree.delete(item)
-        
-        # Add applications
-        for i, app in enumerate(self.current_applications):
-            self.app_tree.insert(
-                "",
-                "end",
-                text=f"App {i+1}",
-                values=(
-                    toHexString(app.aid),
-                    app.life_cycle.name,
-                    f"0x{app.privileges:02X}"
-                )
-            )
+        self.app_view.set_rows(self._app_display)
     
     def show_create_security_domain_dialog(self):
         """Show dialog to create a new security domain"""
@@ -1697,7 +2442,7 @@ Instructions:
         ctk.CTkComboBox(
             dialog,
             variable=domain_type_var,
-            values=["SSD", "AMSD", "DMSD"]
+            values=self.DOMAIN_TYPES
         ).pack(pady=5)
         
         # Privileges
@@ -1721,16 +2466,21 @@ Instructions:
                 
                 aid_bytes = bytes.fromhex(aid_hex)
                 privileges = int(privileges_hex, 16)
-                
-                if self.gp_manager.create_security_domain(aid_bytes, domain_type, privileges):
+            except ValueError as e:
+                messagebox.showerror("Error", f"Invalid input: {e}")
+                return
+            
+            self.run_bg(partial(self.gp_manager.create_security_domain, aid_bytes, domain_type, privileges),
+                        created)
+        
+        def created(future):
+            try:
+                if future.result():
                     messagebox.showinfo("Success", "Security domain created successfully")
                     dialog.destroy()
                     self.refresh_card_data()
                 else:
                     messagebox.showerror("Error", "Failed to create security domain")
-                    
-            except ValueError as e:
-                messagebox.showerror("Error", f"Invalid input: {e}")
             except Exception as e:
                 messagebox.showerror("Error", f"Creation error: {e}")
         
@@ -1752,17 +2502,21 @@ Instructions:
         
         try:
             aid_bytes = bytes.fromhex(aid_hex)
-            
-            if self.gp_manager.perform_clfdb(aid_bytes, operation):
-                messagebox.showinfo("Success", f"CLFDB {operation} completed successfully")
-                self.refresh_card_data()
-            else:
-                messagebox.showerror("Error", f"CLFDB {operation} failed")
-                
         except ValueError:
             messagebox.showerror("Error", "Invalid AID format")
-        except Exception as e:
-            messagebox.showerror("Error", f"CLFDB error: {e}")
+            return
+        
+        def done(future):
+            try:
+                if future.result():
+                    messagebox.showinfo("Success", f"CLFDB {operation} completed successfully")
+                    self.refresh_card_data()
+                else:
+                    messagebox.showerror("Error", f"CLFDB {operation} failed")
+            except Exception as e:
+                messagebox.showerror("Error", f"CLFDB error: {e}")
+        
+        self.run_bg(partial(self.gp_manager.perform_clfdb, aid_bytes, operation), done)
     
     def execute_extradition(self):
         """Execute extradition operation"""
@@ -1780,17 +2534,21 @@ Instructions:
         try:
             obj_aid_bytes = bytes.fromhex(obj_aid_hex)
             target_aid_bytes = bytes.fromhex(target_aid_hex)
-            
-            if self.gp_manager.extradite_object(obj_aid_bytes, target_aid_bytes):
-                messagebox.showinfo("Success", "Extradition completed successfully")
-                self.refresh_card_data()
-            else:
-                messagebox.showerror("Error", "Extradition failed")
-                
         except ValueError:
             messagebox.showerror("Error", "Invalid AID format")
-        except Exception as e:
-            messagebox.showerror("Error", f"Extradition error: {e}")
+            return
+        
+        def done(future):
+            try:
+                if future.result():
+                    messagebox.showinfo("Success", "Extradition completed successfully")
+                    self.refresh_card_data()
+                else:
+                    messagebox.showerror("Error", "Extradition failed")
+            except Exception as e:
+                messagebox.showerror("Error", f"Extradition error: {e}")
+        
+        self.run_bg(partial(self.gp_manager.extradite_object, obj_aid_bytes, target_aid_bytes), done)
     
     def browse_output_directory(self):
         """Browse for output directory"""
@@ -1809,30 +2567,15 @@ Instructions:
             messagebox.showwarning("Warning", "No card data available. Please connect and refresh first.")
             return
         
-        def generate_thread():
-            try:
-                self.root.after(0, lambda: self.update_status("Generating visualizations..."))
-                
-                # Get output directory
-                output_dir = self.viz_dir_entry.get().strip() or "output"
-                
-                # Set visualizer output directory
-                self.visualizer.output_dir = output_dir
-                os.makedirs(output_dir, exist_ok=True)
-                
-                # Generate visualizations
-                output_files = self.visualizer.generate_all_visualizations(
-                    self.current_domains, self.current_applications
-                )
-                
-                # Update results on main thread
-                self.root.after(0, lambda: self.update_visualization_results(output_files))
-                
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Visualization error: {e}"))
-                self.root.after(0, lambda: self.update_status("Visualization failed"))
+        self.update_status("Generating visualizations...")
         
-        threading.Thread(target=generate_thread, daemon=True).start()
+        # Get output directory
+        output_dir = self.viz_dir_entry.get().strip() or "output"
+        self._submit_visualization(
+            partial(self._bg_visualize, "all", output_dir,
+                    self.current_domains, self.current_applications),
+            self._visualizations_done
+        )
     
     def generate_specific_visualization(self, viz_type: str):
         """Generate specific type of visualization"""
@@ -1840,48 +2583,89 @@ Instructions:
             messagebox.showwarning("Warning", "No card data available. Please connect and refresh first.")
             return
         
-        def generate_thread():
-            try:
-                self.root.after(0, lambda: self.update_status(f"Generating {viz_type} visualization..."))
-                
-                output_dir = self.viz_dir_entry.get().strip() or "output"
-                self.visualizer.output_dir = output_dir
-                os.makedirs(output_dir, exist_ok=True)
-                
-                output_file = None
-                if viz_type == "hierarchy":
-                    output_file = self.visualizer.create_hierarchy_diagram(
-                        self.current_domains, self.current_applications
-                    )
-                elif viz_type == "privileges":
-                    output_file = self.visualizer.create_privilege_matrix(
-                        self.current_domains, self.current_applications
-                    )
-                
-                if output_file:
-                    self.root.after(0, lambda: self.update_visualization_results([output_file]))
-                
-            except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Visualization error: {e}"))
+        self.update_status(f"Generating {viz_type} visualization...")
         
-        threading.Thread(target=generate_thread, daemon=True).start()
+        output_dir = self.viz_dir_entry.get().strip() or "output"
+        self._submit_visualization(
+            partial(self._bg_visualize, viz_type, output_dir,
+                    self.current_domains, self.current_applications),
+            self._visualization_done
+        )
+    
+    def _bg_visualize(self, viz_type: str, output_dir: str, domains, applications):
+        """Worker: render a viz_type visualization; "all" renders every type"""
+        self._prepare_viz_dir(output_dir)
+        
+        if viz_type == "all":
+            return self.visualizer.generate_all_visualizations(domains, applications)
+        elif viz_type == "hierarchy":
+            return self.visualizer.create_hierarchy_diagram(domains, applications)
+        elif viz_type == "privileges":
+            return self.visualizer.create_privilege_matrix(domains, applications)
+        return None
+    
+    def _visualizations_done(self, future: Future):
+        """Show the files of a finished "all" visualization job (UI thread)"""
+        try:
+            self.update_visualization_results(future.result())
+        except Exception as e:
+            messagebox.showerror("Error", f"Visualization error: {e}")
+            self.update_status("Visualization failed")
+    
+    def _visualization_done(self, future: Future):
+        """Show the file of a finished single visualization job (UI thread)"""
+        try:
+            output_file = future.result()
+            if output_file:
+                self.update_visualization_results([output_file])
+        except Exception as e:
+            messagebox.showerror("Error", f"Visualization error: {e}")
+    
+    def _prepare_viz_dir(self, output_dir: str):
+        """Worker: point the visualizer at output_dir, creating it if it is new"""
+        if output_dir != self._viz_dir_prepared:
+            os.makedirs(output_dir, exist_ok=True)
+            self._viz_dir_prepared = output_dir
+        self.visualizer.output_dir = output_dir
+    
+    def _forget_viz_dir(self):
+        """Make the next visualization job check its output directory again"""
+        self._viz_dir_prepared = None
+    
+    def _submit_visualization(self, generate, done):
+        """Queue a visualization job, dropping one that is still waiting to start"""
+        if self._viz_future is not None:
+            self._viz_future.cancel()
+        self._viz_future = self.run_bg(generate, partial(self._viz_finished, done), self._viz_pool)
+    
+    def _viz_finished(self, done, future: Future):
+        """Hand a visualization job that ran to its done callback (UI thread)"""
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            # The directory may have gone away under us
+            self._forget_viz_dir()
+        done(future)
     
     def update_visualization_results(self, output_files: List[str]):
         """Update visualization results"""
-        self.viz_results.delete("1.0", "end")
-        
         if output_files:
-            self.viz_results.insert("end", f"✅ Generated {len(output_files)} visualization(s):\n\n")
+            lines = [f"✅ Generated {len(output_files)} visualization(s):", ""]
             for file_path in output_files:
-                if os.path.exists(file_path):
-                    file_size = os.path.getsize(file_path)
-                    self.viz_results.insert("end", f"📄 {os.path.basename(file_path)}\n")
-                    self.viz_results.insert("end", f"   Path: {file_path}\n")
-                    self.viz_results.insert("end", f"   Size: {file_size:,} bytes\n\n")
+                # One stat per file; files that are gone are skipped
+                try:
+                    file_size = os.stat(file_path).st_size
+                except FileNotFoundError:
+                    continue
+                lines += [f"📄 {os.path.basename(file_path)}",
+                          f"   Path: {file_path}",
+                          f"   Size: {file_size:,} bytes",
+                          ""]
+            _write_lines(self.viz_results, lines, replace=True)
             
             self.update_status(f"Generated {len(output_files)} visualizations")
         else:
-            self.viz_results.insert("end", "❌ No visualizations were generated")
+            _write_lines(self.viz_results, ["❌ No visualizations were generated"], replace=True)
             self.update_status("No visualizations generated")
     
     def change_theme(self, theme: str):
@@ -1889,16 +2673,36 @@ Instructions:
         ctk.set_appearance_mode(theme)
         self.update_status(f"Theme changed to {theme}")
     
+    def change_automatic_dpi(self):
+        """Persist the automatic DPI scaling setting for the next start"""
+        self.config_manager.get_gui_config().automatic_dpi = self.automatic_dpi_var.get()
+        self.config_manager.save_settings()
+        self.update_status("DPI scaling setting saved; restart to apply")
+    
     def run(self):
         """Run the GUI application"""
         self.root.mainloop()
 
 
 class KeysetDialog:
-    """Dialog for adding/editing keysets"""
+    """Dialog for adding/editing keysets
+
+    The dialog does not block: future resolves to the entered keyset data,
+    or None if it was cancelled, and its callbacks run on the UI thread.
+    """
+    
+    # (label, entry attribute) for the three 16-byte session keys
+    KEY_FIELDS = (
+        ("ENC Key:", "enc_key_entry"), ("MAC Key:", "mac_key_entry"),
+        ("DEK Key:", "dek_key_entry"),
+    )
+    
+    # Created with the first dialog (a Tk root must exist) and shared after that
+    _title_font: Optional[ctk.CTkFont] = None
     
     def __init__(self, parent, title, keyset=None):
         self.result = None
+        self.future: Future = Future()
         
         # Create dialog window
         self.dialog = ctk.CTkToplevel(parent)
@@ -1906,6 +2710,7 @@ class KeysetDialog:
         self.dialog.geometry("500x600")
         self.dialog.transient(parent)
         self.dialog.grab_set()
+        self.dialog.protocol("WM_DELETE_WINDOW", self.cancel)
         
         # Center the dialog
         self.dialog.update_idletasks()
@@ -1923,7 +2728,9 @@ class KeysetDialog:
         main_frame.grid_columnconfigure(1, weight=1)
         
         # Title
-        title_label = ctk.CTkLabel(main_frame, text=title, font=ctk.CTkFont(size=18, weight="bold"))
+        if KeysetDialog._title_font is None:
+            KeysetDialog._title_font = ctk.CTkFont(size=18, weight="bold")
+        title_label = ctk.CTkLabel(main_frame, text=title, font=KeysetDialog._title_font)
         title_label.grid(row=0, column=0, columnspan=2, pady=(0, 20))
         
         row = 1
@@ -1941,23 +2748,13 @@ class KeysetDialog:
         self.protocol_combo.grid(row=row, column=1, sticky="ew", padx=(10, 0), pady=5)
         row += 1
         
-        # ENC Key field
-        ctk.CTkLabel(main_frame, text="ENC Key:").grid(row=row, column=0, sticky="w", pady=5)
-        self.enc_key_entry = ctk.CTkEntry(main_frame, width=300, placeholder_text="32 hex characters (16 bytes)")
-        self.enc_key_entry.grid(row=row, column=1, sticky="ew", padx=(10, 0), pady=5)
-        row += 1
-        
-        # MAC Key field
-        ctk.CTkLabel(main_frame, text="MAC Key:").grid(row=row, column=0, sticky="w", pady=5)
-        self.mac_key_entry = ctk.CTkEntry(main_frame, width=300, placeholder_text="32 hex characters (16 bytes)")
-        self.mac_key_entry.grid(row=row, column=1, sticky="ew", padx=(10, 0), pady=5)
-        row += 1
-        
-        # DEK Key field
-        ctk.CTkLabel(main_frame, text="DEK Key:").grid(row=row, column=0, sticky="w", pady=5)
-        self.dek_key_entry = ctk.CTkEntry(main_frame, width=300, placeholder_text="32 hex characters (16 bytes)")
-        self.dek_key_entry.grid(row=row, column=1, sticky="ew", padx=(10, 0), pady=5)
-        row += 1
+        # ENC/MAC/DEK key fields
+        for label, attr in self.KEY_FIELDS:
+            ctk.CTkLabel(main_frame, text=label).grid(row=row, column=0, sticky="w", pady=5)
+            entry = ctk.CTkEntry(main_frame, width=300, placeholder_text="32 hex characters (16 bytes)")
+            entry.grid(row=row, column=1, sticky="ew", padx=(10, 0), pady=5)
+            setattr(self, attr, entry)
+            row += 1
         
         # Key Version field
         ctk.CTkLabel(main_frame, text="Key Version:").grid(row=row, column=0, sticky="w", pady=5)
@@ -2012,19 +2809,10 @@ class KeysetDialog:
         
         # Focus on name field
         self.name_entry.focus()
-        
-        # Wait for dialog to close
-        self.dialog.wait_window()
     
     def validate_hex_key(self, key: str) -> bool:
-        """Validate hex key format"""
-        if len(key) != 32:
-            return False
-        try:
-            int(key, 16)
-            return True
-        except ValueError:
-            return False
+        """Validate hex key format: exactly 32 hex digits"""
+        return _KEY_HEX_RE.fullmatch(key) is not None
     
     def save(self):
         """Save the keyset data"""
@@ -2032,9 +2820,9 @@ class KeysetDialog:
             # Get values
             name = self.name_entry.get().strip()
             protocol = self.protocol_var.get()
-            enc_key = self.enc_key_entry.get().strip().upper()
-            mac_key = self.mac_key_entry.get().strip().upper()
-            dek_key = self.dek_key_entry.get().strip().upper()
+            enc_key = self.enc_key_entry.get().strip()
+            mac_key = self.mac_key_entry.get().strip()
+            dek_key = self.dek_key_entry.get().strip()
             key_version = int(self.key_version_var.get())
             security_level = int(self.security_level_var.get())
             description = self.description_text.get("1.0", "end").strip()
@@ -2044,17 +2832,10 @@ class KeysetDialog:
                 messagebox.showerror("Error", "Name is required")
                 return
             
-            if not self.validate_hex_key(enc_key):
-                messagebox.showerror("Error", "ENC Key must be 32 hex characters")
-                return
-            
-            if not self.validate_hex_key(mac_key):
-                messagebox.showerror("Error", "MAC Key must be 32 hex characters")
-                return
-            
-            if not self.validate_hex_key(dek_key):
-                messagebox.showerror("Error", "DEK Key must be 32 hex characters")
-                return
+            for label, key in (("ENC", enc_key), ("MAC", mac_key), ("DEK", dek_key)):
+                if not self.validate_hex_key(key):
+                    messagebox.showerror("Error", f"{label} Key must be 32 hex characters")
+                    return
             
             if not 0 <= key_version <= 255:
                 messagebox.showerror("Error", "Key version must be 0-255")
@@ -2064,19 +2845,20 @@ class KeysetDialog:
                 messagebox.showerror("Error", "Security level must be 1, 2, or 3")
                 return
             
-            # Set result
+            # Set result; keys are stored in uppercase once they are known to be valid
             self.result = {
                 'name': name,
                 'protocol': protocol,
-                'enc_key': enc_key,
-                'mac_key': mac_key,
-                'dek_key': dek_key,
+                'enc_key': enc_key.upper(),
+                'mac_key': mac_key.upper(),
+                'dek_key': dek_key.upper(),
                 'key_version': key_version,
                 'security_level': security_level,
                 'description': description
             }
             
             self.dialog.destroy()
+            self.future.set_result(self.result)
             
         except ValueError as e:
             messagebox.showerror("Error", f"Invalid input: {e}")
@@ -2086,6 +2868,7 @@ class KeysetDialog:
     def cancel(self):
         """Cancel the dialog"""
         self.dialog.destroy()
+        self.future.set_result(None)
 
 
 def main():
@@ -8,8 +8,19 @@ import os
 import sys
 import subprocess
 import platform
+import importlib.util
 from pathlib import Path
 
+# Tool modules (found in src/) and the third-party packages they import
+PROJECT_MODULES = (
+    "smartcard_manager", "config_manager", "globalplatform",
+    "secure_channel", "visualization",
+)
+DEPENDENCY_MODULES = (
+    "smartcard", "cryptography", "click", "colorama", "tabulate", "yaml",
+    "matplotlib", "networkx", "numpy", "customtkinter", "PIL",
+)
+
 
 def print_banner():
     """Print installation banner"""
@@ -67,13 +78,15 @@ def install_dependencies():
     print("📦 Installing Python dependencies...")
     
     try:
+        # Skip pip's online self-version check and never wait for a prompt
+        pip_install = [sys.executable, "-m", "pip", "install",
+                       "--disable-pip-version-check", "--no-input"]
+        
         # Upgrade pip first
-        subprocess.run([sys.executable, "-m", "pip", "install", "--upgrade", "pip"], 
-                      check=True)
+        subprocess.run(pip_install + ["--upgrade", "pip"], check=True)
         
         # Install requirements
-        subprocess.run([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], 
-                      check=True)
+        subprocess.run(pip_install + ["-r", "requirements.txt"], check=True)
         
         print("✅ Dependencies installed successfully")
         return True
@@ -99,23 +112,26 @@ def test_installation():
     print("🧪 Testing installation...")
     
     try:
-        # Test imports
+        # Locate modules without running them, so each missing one is named
         sys.path.insert(0, "src")
         
-        from src.smartcard_manager import SmartcardManager
-        from src.config_manager import ConfigManager
-        from src.globalplatform import GlobalPlatformManager
-        from src.secure_channel import SecureChannelManager
-        from src.visualization import SecurityDomainVisualizer
+        missing = [name for name in PROJECT_MODULES + DEPENDENCY_MODULES
+                   if importlib.util.find_spec(name) is None]
+        if missing:
+            for name in missing:
+                print(f"❌ Missing module: {name}")
+            return False
         
-        print("✅ All modules imported successfully")
+        print("✅ All modules found")
         
         # Test configuration loading
+        from src.config_manager import ConfigManager
         config_manager = ConfigManager()
         keysets = config_manager.list_keysets()
         print(f"✅ Configuration loaded: {len(keysets)} keysets found")
         
         # Test PC/SC reader enumeration
+        from src.smartcard_manager import SmartcardManager
         sc_manager = SmartcardManager()
         readers = sc_manager.list_readers()
         print(f"✅ PC/SC interface working: {len(readers)} readers found")
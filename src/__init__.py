@@ -7,11 +7,40 @@ __version__ = "1.0.0"
 __author__ = "CCM Tool Developer"
 __email__ = "developer@example.com"
 
-from .smartcard_manager import SmartcardManager, APDUCommand, APDUResponse, SmartcardException
-from .globalplatform import GlobalPlatformManager, SecurityDomainInfo, ApplicationInfo, LifeCycleState
-from .secure_channel import SecureChannelManager, KeySet, SecureChannelSession
-from .config_manager import ConfigManager
-from .visualization import SecurityDomainVisualizer
+from importlib import import_module
+
+# Re-exports are imported on first access (PEP 562), so importing one
+# submodule, e.g. src.config_manager, does not load every backend and
+# matplotlib with it
+_EXPORTS = {
+    'SmartcardManager': '.smartcard_manager',
+    'APDUCommand': '.smartcard_manager',
+    'APDUResponse': '.smartcard_manager',
+    'SmartcardException': '.smartcard_manager',
+    'GlobalPlatformManager': '.globalplatform',
+    'SecurityDomainInfo': '.globalplatform',
+    'ApplicationInfo': '.globalplatform',
+    'LifeCycleState': '.globalplatform',
+    'SecureChannelManager': '.secure_channel',
+    'KeySet': '.secure_channel',
+    'SecureChannelSession': '.secure_channel',
+    'ConfigManager': '.config_manager',
+    'SecurityDomainVisualizer': '.visualization',
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
+
 
 __all__ = [
     'SmartcardManager',
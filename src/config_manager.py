@@ -53,6 +53,14 @@ class VisualizationConfig:
     show_lifecycle: bool
 
 
+@dataclass
+class GuiConfig:
+    """GUI scaling configuration"""
+    automatic_dpi: bool = False
+    widget_scaling: float = 1.0
+    window_scaling: float = 1.0
+
+
 class ConfigManager:
     """Manages configuration files and settings with SQLite database integration"""
     
@@ -66,6 +74,7 @@ class ConfigManager:
         self.pcsc_config: Optional[PCSCConfig] = None
         self.gp_config: Optional[GlobalPlatformConfig] = None
         self.viz_config: Optional[VisualizationConfig] = None
+        self.gui_config: Optional[GuiConfig] = None
         
         self.load_all_configs()
     
@@ -382,6 +391,10 @@ class ConfigManager:
             if 'visualization' in config:
                 self.viz_config = VisualizationConfig(**config['visualization'])
             
+            # Load GUI config
+            if 'gui' in config:
+                self.gui_config = GuiConfig(**config['gui'])
+            
             logger.info("Settings loaded successfully")
             
         except Exception as e:
@@ -418,6 +431,8 @@ class ConfigManager:
             show_privileges=True,
             show_lifecycle=True
         )
+        
+        self.gui_config = GuiConfig()
     
     def get_keyset(self, name: str) -> Optional[KeySet]:
         """Get a keyset by name"""
@@ -522,6 +537,13 @@ class ConfigManager:
                     'show_lifecycle': self.viz_config.show_lifecycle
                 }
             
+            if self.gui_config:
+                config['gui'] = {
+                    'automatic_dpi': self.gui_config.automatic_dpi,
+                    'widget_scaling': self.gui_config.widget_scaling,
+                    'window_scaling': self.gui_config.window_scaling
+                }
+            
             with open(settings_file, 'w', encoding='utf-8') as f:
                 yaml.dump(config, f, default_flow_style=False, indent=2)
             
@@ -595,3 +617,9 @@ class ConfigManager:
             return self.viz_config.output_directory
         else:
             return "output"  # Default directory
+    
+    def get_gui_config(self) -> GuiConfig:
+        """Get GUI scaling configuration"""
+        if self.gui_config is None:
+            self.gui_config = GuiConfig()
+        return self.gui_config
@@ -6,7 +6,8 @@ Provides SQLite-based storage for multiple keyset value sets and SMS-PP envelope
 import sqlite3
 import logging
 import json
-from typing import Dict, List, Optional, Any, Tuple
+import sys
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from datetime import datetime
@@ -270,6 +271,14 @@ class DatabaseManager:
     
     # Keyset Management Methods
     
+    @staticmethod
+    def _keyset_from_row(row) -> KeysetRecord:
+        """Build a KeysetRecord, interning the short strings used for grouping"""
+        record = KeysetRecord(*row)
+        record.value_set = sys.intern(record.value_set)
+        record.protocol = sys.intern(record.protocol)
+        return record
+    
     def add_keyset(self, keyset: KeysetRecord) -> int:
         """Add a new keyset to the database"""
         current_time = datetime.now().isoformat()
@@ -321,7 +330,7 @@ class DatabaseManager:
                 cursor.execute(query, params)
                 rows = cursor.fetchall()
                 
-                return [KeysetRecord(*row) for row in rows]
+                return [self._keyset_from_row(row) for row in rows]
         except sqlite3.Error as e:
             logger.error(f"Database error getting keysets: {e}")
             return []
@@ -337,11 +346,25 @@ class DatabaseManager:
                 """, (name, value_set))
                 
                 row = cursor.fetchone()
-                return KeysetRecord(*row) if row else None
+                return self._keyset_from_row(row) if row else None
         except sqlite3.Error as e:
             logger.error(f"Database error getting keyset: {e}")
             return None
     
+    def get_keyset_names(self, value_set: str) -> List[str]:
+        """Get the names of the active keysets in a value set"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT name FROM keysets 
+                    WHERE value_set = ? AND is_active = 1 ORDER BY name
+                """, (value_set,))
+                return [row[0] for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            logger.error(f"Database error getting keyset names: {e}")
+            return []
+    
     def update_keyset(self, keyset: KeysetRecord) -> bool:
         """Update an existing keyset"""
         keyset.updated_at = datetime.now().isoformat()
@@ -468,25 +491,38 @@ class DatabaseManager:
             logger.error(f"Database error adding OTA message: {e}")
             raise
     
+    def _build_ota_messages_query(self, status: Optional[str], target_aid: Optional[str],
+                                  limit: Optional[int] = None,
+                                  offset: int = 0) -> Tuple[str, List[Any]]:
+        """Build the filtered OTA message query and its parameters"""
+        query = "SELECT * FROM ota_messages WHERE 1=1"
+        params: List[Any] = []
+        
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+        
+        if target_aid:
+            query += " AND target_aid = ?"
+            params.append(target_aid)
+        
+        query += " ORDER BY created_at DESC"
+        
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+        
+        return query, params
+    
     def get_ota_messages(self, status: Optional[str] = None, 
-                        target_aid: Optional[str] = None) -> List[OTAMessage]:
-        """Get OTA messages filtered by status and/or target AID"""
+                        target_aid: Optional[str] = None,
+                        limit: Optional[int] = None) -> List[OTAMessage]:
+        """Get OTA messages filtered by status and/or target AID, newest first"""
         try:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 
-                query = "SELECT * FROM ota_messages WHERE 1=1"
-                params = []
-                
-                if status:
-                    query += " AND status = ?"
-                    params.append(status)
-                
-                if target_aid:
-                    query += " AND target_aid = ?"
-                    params.append(target_aid)
-                
-                query += " ORDER BY created_at DESC"
+                query, params = self._build_ota_messages_query(status, target_aid, limit)
                 
                 cursor.execute(query, params)
                 rows = cursor.fetchall()
@@ -495,3 +531,39 @@ class DatabaseManager:
         except sqlite3.Error as e:
             logger.error(f"Database error getting OTA messages: {e}")
             return []
+    
+    def count_ota_messages(self, status: Optional[str] = None,
+                           target_aid: Optional[str] = None,
+                           limit: Optional[int] = None, offset: int = 0) -> int:
+        """Count the OTA messages get_ota_messages_iter would yield"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                
+                query, params = self._build_ota_messages_query(status, target_aid, limit, offset)
+                
+                cursor.execute(f"SELECT COUNT(*) FROM ({query})", params)
+                return cursor.fetchone()[0]
+        except sqlite3.Error as e:
+            logger.error(f"Database error counting OTA messages: {e}")
+            return 0
+    
+    def get_ota_messages_iter(self, status: Optional[str] = None,
+                              target_aid: Optional[str] = None,
+                              limit: Optional[int] = None, offset: int = 0,
+                              chunk_size: int = 256) -> Iterator[List[OTAMessage]]:
+        """Yield OTA messages in chunks of at most chunk_size records"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                
+                query, params = self._build_ota_messages_query(status, target_aid, limit, offset)
+                
+                cursor.execute(query, params)
+                while True:
+                    rows = cursor.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    yield [OTAMessage(*row) for row in rows]
+        except sqlite3.Error as e:
+            logger.error(f"Database error getting OTA messages: {e}")
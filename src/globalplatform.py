@@ -144,25 +144,21 @@ class GlobalPlatformManager:
                 le=0x00
             )
             
-            response = self.sc_manager.send_apdu(command)
+            next_command = APDUCommand(
+                cla=0x80,
+                ins=0xF2,
+                p1=p1,
+                p2=0x01,  # Get next occurrence
+                le=0x00
+            )
             
-            if response.is_success or response.sw == 0x6310:  # More data available
+            # 0x6310 = more data available; the next page is fetched while
+            # the current one is being parsed
+            for response in self.sc_manager.transmit_pipelined(
+                    command, next_command, lambda r: r.sw == 0x6310):
+                if not (response.is_success or response.sw == 0x6310):
+                    break
                 objects.extend(self._parse_status_response(response.data))
-                
-                # Handle continuation if more data available
-                while response.sw == 0x6310:
-                    command = APDUCommand(
-                        cla=0x80,
-                        ins=0xF2,
-                        p1=p1,
-                        p2=0x01,  # Get next occurrence
-                        le=0x00
-                    )
-                    response = self.sc_manager.send_apdu(command)
-                    if response.is_success or response.sw == 0x6310:
-                        objects.extend(self._parse_status_response(response.data))
-                    else:
-                        break
             
             logger.info(f"Retrieved {len(objects)} objects from GET STATUS")
             return objects
@@ -223,19 +219,29 @@ class GlobalPlatformManager:
         
         return objects
     
+    def _to_application_info(self, obj: Dict[str, Any]) -> ApplicationInfo:
+        """Build ApplicationInfo from a parsed GET STATUS entry"""
+        return ApplicationInfo(
+            aid=obj['aid'],
+            life_cycle=LifeCycleState(obj['life_cycle']),
+            privileges=obj['privileges']
+        )
+    
+    def _to_security_domain_info(self, obj: Dict[str, Any]) -> SecurityDomainInfo:
+        """Build SecurityDomainInfo from a parsed GET STATUS entry"""
+        return SecurityDomainInfo(
+            aid=obj['aid'],
+            life_cycle=LifeCycleState(obj['life_cycle']),
+            privileges=obj['privileges'],
+            domain_type=obj['type'],
+            associated_applications=[]
+        )
+    
     def list_applications(self) -> List[ApplicationInfo]:
         """List all installed applications"""
         status_data = self.get_status(p1=0x40)  # Applications and Security Domains
-        applications = []
-        
-        for obj in status_data:
-            if obj['type'] == 'Application':
-                app_info = ApplicationInfo(
-                    aid=obj['aid'],
-                    life_cycle=LifeCycleState(obj['life_cycle']),
-                    privileges=obj['privileges']
-                )
-                applications.append(app_info)
+        applications = [self._to_application_info(obj) for obj in status_data
+                        if obj['type'] == 'Application']
         
         logger.info(f"Found {len(applications)} applications")
         return applications
@@ -243,26 +249,38 @@ class GlobalPlatformManager:
     def list_security_domains(self) -> List[SecurityDomainInfo]:
         """List all security domains"""
         status_data = self.get_status(p1=0x80)  # Security Domains only
-        security_domains = []
-        
-        for obj in status_data:
-            if obj['type'] in ['ISD', 'SSD', 'DMSD']:
-                sd_info = SecurityDomainInfo(
-                    aid=obj['aid'],
-                    life_cycle=LifeCycleState(obj['life_cycle']),
-                    privileges=obj['privileges'],
-                    domain_type=obj['type'],
-                    associated_applications=[]
-                )
-                security_domains.append(sd_info)
+        security_domains = [self._to_security_domain_info(obj) for obj in status_data
+                            if obj['type'] in ('ISD', 'SSD', 'DMSD')]
         
         logger.info(f"Found {len(security_domains)} security domains")
         return security_domains
     
-    def create_security_domain(self, aid: bytes, domain_type: str, privileges: int = 0x80) -> bool:
+    def list_all(self, scope: Tuple[str, ...] = ("SD", "APP")
+                 ) -> Tuple[List[SecurityDomainInfo], List[ApplicationInfo]]:
+        """
+        List security domains and/or applications in one pass
+        scope: any of 'SD', 'APP'; the GET STATUS sequences are issued
+        back-to-back under the currently selected Card Manager
+        """
+        sd_status = self.get_status(p1=0x80) if "SD" in scope else []
+        app_status = self.get_status(p1=0x40) if "APP" in scope else []
+        
+        security_domains = [self._to_security_domain_info(obj) for obj in sd_status
+                            if obj['type'] in ('ISD', 'SSD', 'DMSD')]
+        applications = [self._to_application_info(obj) for obj in app_status
+                        if obj['type'] == 'Application']
+        
+        logger.info(f"Found {len(security_domains)} security domains and "
+                    f"{len(applications)} applications")
+        return security_domains, applications
+    
+    def create_security_domain(self, aid: bytes, domain_type: str,
+                               privileges: int = 0x80) -> Optional[SecurityDomainInfo]:
         """
         Create a new security domain
         domain_type: 'SSD', 'AMSD', 'DMSD'
+        Returns the created domain so callers can update cached listings
+        without another GET STATUS, or None on failure.
         """
         try:
             # INSTALL [for personalization and make selectable] command
@@ -281,14 +299,20 @@ class GlobalPlatformManager:
             
             if response.is_success:
                 logger.info(f"Successfully created {domain_type} with AID: {toHexString(aid)}")
-                return True
+                return SecurityDomainInfo(
+                    aid=aid,
+                    life_cycle=LifeCycleState.SELECTABLE,
+                    privileges=privileges,
+                    domain_type=domain_type,
+                    associated_applications=[]
+                )
             else:
                 logger.error(f"Failed to create security domain: SW={response.sw:04X}")
-                return False
+                return None
                 
         except Exception as e:
             logger.error(f"Error creating security domain: {e}")
-            return False
+            return None
     
     def _build_install_data(self, aid: bytes, domain_type: str, privileges: int) -> bytes:
         """Build INSTALL command data"""
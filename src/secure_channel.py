@@ -4,8 +4,8 @@ Handles secure channel establishment and secure APDU communication.
 """
 
 import logging
-from typing import Dict, Optional, Tuple, Any
-from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple, Any
+from dataclasses import dataclass, field
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives import hashes, cmac
 from cryptography.hazmat.backends import default_backend
@@ -17,6 +17,13 @@ from smartcard.util import toHexString, toBytes
 logger = logging.getLogger(__name__)
 
 
+def _aes_cmac(key: bytes, data: bytes) -> bytes:
+    """AES-CMAC of data under key"""
+    c = cmac.CMAC(algorithms.AES(key), backend=default_backend())
+    c.update(data)
+    return c.finalize()
+
+
 @dataclass
 class KeySet:
     """Represents a set of cryptographic keys"""
@@ -46,10 +53,21 @@ class SecureChannelSession:
     session_keys: Dict[str, bytes]
     sequence_counter: int
     mac_chaining_value: bytes
+    # CMAC context keyed with the session MAC key; lives and dies with the session
+    _mac_template: Optional[cmac.CMAC] = field(default=None, init=False, repr=False, compare=False)
     
     def increment_sequence(self):
         """Increment sequence counter for SCP03"""
         self.sequence_counter = (self.sequence_counter + 1) & 0xFFFFFF
+    
+    def mac(self, data: bytes) -> bytes:
+        """AES-CMAC of data under the session MAC key, expanding its key schedule once"""
+        if self._mac_template is None:
+            self._mac_template = cmac.CMAC(algorithms.AES(self.session_keys['mac']),
+                                           backend=default_backend())
+        c = self._mac_template.copy()
+        c.update(data)
+        return c.finalize()
 
 
 class SecureChannelManager:
@@ -76,11 +94,48 @@ class SecureChannelManager:
             logger.error(f"Error establishing secure channel: {e}")
             return False
     
-    def _establish_scp02(self, keyset: KeySet, security_level: int) -> bool:
-        """Establish SCP02 secure channel"""
-        logger.info("Establishing SCP02 secure channel")
+    def establish_first_secure_channel(self, candidates: Sequence[Tuple[str, KeySet]],
+                                       security_level: int = 3) -> Optional[str]:
+        """
+        Try (name, keyset) candidates in order and keep the first that authenticates
+        A key version the card rejects at INITIALIZE UPDATE is not probed again
+        for later candidates. Returns the name of the keyset in use, or None.
+        """
+        rejected_versions = set()
+        
+        for name, keyset in candidates:
+            if keyset.protocol not in ("SCP02", "SCP03"):
+                logger.error(f"Unsupported protocol for keyset {name}: {keyset.protocol}")
+                continue
+            if keyset.key_version in rejected_versions:
+                logger.info(f"Skipping keyset {name}: key version {keyset.key_version:02X} rejected by card")
+                continue
+            
+            try:
+                probe = self._init_update_probe(keyset)
+                if probe is None:
+                    rejected_versions.add(keyset.key_version)
+                    continue
+                
+                # EXTERNAL AUTHENTICATE must follow the INITIALIZE UPDATE it answers
+                if keyset.protocol == "SCP02":
+                    established = self._authenticate_scp02(keyset, security_level, *probe)
+                else:
+                    established = self._authenticate_scp03(keyset, security_level, *probe)
+            except Exception as e:
+                logger.error(f"Error establishing secure channel with {name}: {e}")
+                continue
+            
+            if established:
+                return name
         
-        # Step 1: INITIALIZE UPDATE
+        return None
+    
+    def _init_update_probe(self, keyset: KeySet) -> Optional[Tuple[bytes, APDUResponse]]:
+        """
+        Send INITIALIZE UPDATE for a keyset without authenticating
+        Returns (host_challenge, response), or None if the card rejected it
+        """
         host_challenge = os.urandom(8)
         
         command = APDUCommand(
@@ -95,8 +150,24 @@ class SecureChannelManager:
         response = self.sc_manager.send_apdu(command)
         if not response.is_success:
             logger.error(f"INITIALIZE UPDATE failed: SW={response.sw:04X}")
+            return None
+        
+        return host_challenge, response
+    
+    def _establish_scp02(self, keyset: KeySet, security_level: int) -> bool:
+        """Establish SCP02 secure channel"""
+        logger.info("Establishing SCP02 secure channel")
+        
+        # Step 1: INITIALIZE UPDATE
+        probe = self._init_update_probe(keyset)
+        if probe is None:
             return False
         
+        return self._authenticate_scp02(keyset, security_level, *probe)
+    
+    def _authenticate_scp02(self, keyset: KeySet, security_level: int,
+                             host_challenge: bytes, response: APDUResponse) -> bool:
+        """Verify the card cryptogram and complete SCP02 with EXTERNAL AUTHENTICATE"""
         if len(response.data) < 28:
             logger.error("Invalid INITIALIZE UPDATE response length")
             return False
@@ -156,22 +227,15 @@ class SecureChannelManager:
         logger.info("Establishing SCP03 secure channel")
         
         # Step 1: INITIALIZE UPDATE
-        host_challenge = os.urandom(8)
-        
-        command = APDUCommand(
-            cla=0x80,
-            ins=0x50,
-            p1=keyset.key_version,
-            p2=0x00,
-            data=host_challenge,
-            le=0x00
-        )
-        
-        response = self.sc_manager.send_apdu(command)
-        if not response.is_success:
-            logger.error(f"INITIALIZE UPDATE failed: SW={response.sw:04X}")
+        probe = self._init_update_probe(keyset)
+        if probe is None:
             return False
         
+        return self._authenticate_scp03(keyset, security_level, *probe)
+    
+    def _authenticate_scp03(self, keyset: KeySet, security_level: int,
+                             host_challenge: bytes, response: APDUResponse) -> bool:
+        """Verify the card cryptogram and complete SCP03 with EXTERNAL AUTHENTICATE"""
         if len(response.data) < 29:
             logger.error("Invalid INITIALIZE UPDATE response length")
             return False
@@ -271,9 +335,7 @@ class SecureChannelManager:
         # KDF as per SCP03 specification
         input_data = label + b'\x00' + context + struct.pack('>H', length * 8)
         
-        c = cmac.CMAC(algorithms.AES(key), backend=self.backend)
-        c.update(input_data)
-        return c.finalize()[:length]
+        return _aes_cmac(key, input_data)[:length]
     
     def _encrypt_des3(self, key: bytes, data: bytes) -> bytes:
         """3DES encryption helper"""
@@ -308,9 +370,7 @@ class SecureChannelManager:
                           b'\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00')
         
         # Calculate expected cryptogram using CMAC
-        c = cmac.CMAC(algorithms.AES(session_keys['enc']), backend=self.backend)
-        c.update(cryptogram_data)
-        expected_cryptogram = c.finalize()[:8]
+        expected_cryptogram = _aes_cmac(session_keys['enc'], cryptogram_data)[:8]
         
         return expected_cryptogram == card_cryptogram
     
@@ -329,9 +389,7 @@ class SecureChannelManager:
                           host_challenge + 
                           b'\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00')
         
-        c = cmac.CMAC(algorithms.AES(session_keys['enc']), backend=self.backend)
-        c.update(cryptogram_data)
-        return c.finalize()[:8]
+        return _aes_cmac(session_keys['enc'], cryptogram_data)[:8]
     
     def _apply_scp02_mac(self, command: APDUCommand, session_keys: Dict[str, bytes]) -> APDUCommand:
         """Apply SCP02 MAC to APDU command"""
@@ -355,17 +413,19 @@ class SecureChannelManager:
             le=command.le
         )
     
-    def _apply_scp03_mac(self, command: APDUCommand, session_keys: Dict[str, bytes], sequence_counter: int) -> APDUCommand:
-        """Apply SCP03 MAC to APDU command"""
+    def _apply_scp03_mac(self, command: APDUCommand, session_keys: Dict[str, bytes], sequence_counter: int,
+                         session: Optional[SecureChannelSession] = None) -> APDUCommand:
+        """Apply SCP03 MAC to APDU command, with the session's CMAC context once one exists"""
         # Build MAC data
         mac_data = (struct.pack('>I', sequence_counter)[1:] +
                    bytes([command.cla, command.ins, command.p1, command.p2]) +
                    bytes([len(command.data)]) + command.data)
         
         # Calculate CMAC
-        c = cmac.CMAC(algorithms.AES(session_keys['mac']), backend=self.backend)
-        c.update(mac_data)
-        mac = c.finalize()[:8]
+        if session is not None:
+            mac = session.mac(mac_data)[:8]
+        else:
+            mac = _aes_cmac(session_keys['mac'], mac_data)[:8]
         
         # Append MAC to command data
         new_data = command.data + mac
@@ -390,7 +450,8 @@ class SecureChannelManager:
         elif self.session.protocol == "SCP03":
             self.session.increment_sequence()
             secure_command = self._apply_scp03_mac(
-                command, self.session.session_keys, self.session.sequence_counter
+                command, self.session.session_keys, self.session.sequence_counter,
+                session=self.session
             )
         else:
             raise SmartcardException(f"Unsupported protocol: {self.session.protocol}")
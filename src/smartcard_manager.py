@@ -4,12 +4,18 @@ Provides low-level smartcard communication and basic operations.
 """
 
 import logging
-from typing import List, Optional, Tuple, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional, Tuple, Dict, Any
 from smartcard.System import readers
 from smartcard.CardConnection import CardConnection
 from smartcard.CardType import AnyCardType
 from smartcard.CardRequest import CardRequest
 from smartcard.Exceptions import CardRequestTimeoutException, CardConnectionException
+from smartcard.scard import (
+    SCardBeginTransaction, SCardEndTransaction, SCardGetErrorMessage,
+    SCARD_LEAVE_CARD, SCARD_S_SUCCESS
+)
 from smartcard.util import toHexString, toBytes
 import time
 
@@ -82,15 +88,18 @@ class SmartcardReader:
         self.reader_name = reader_name
         self.connection: Optional[CardConnection] = None
         self.connected = False
+        self._transaction_depth = 0
         
     def connect(self, timeout: int = 5000) -> bool:
-        """Connect to the smartcard in the reader"""
+        """Connect to the smartcard in the reader (timeout in milliseconds)"""
         try:
+            # CardRequest blocks in SCardGetStatusChange rather than polling;
+            # its timeout is expressed in seconds
             cardtype = AnyCardType()
             cardrequest = CardRequest(
                 readers=[self.reader_name],
                 cardType=cardtype,
-                timeout=timeout
+                timeout=timeout / 1000
             )
             
             cardservice = cardrequest.waitforcard()
@@ -147,6 +156,47 @@ class SmartcardReader:
             raise SmartcardException("Not connected to card")
         
         return bytes(self.connection.getATR())
+    
+    def _card_handle(self) -> Optional[int]:
+        """Return the raw PC/SC card handle behind the (possibly decorated) connection"""
+        connection = self.connection
+        while connection is not None and not hasattr(connection, 'hcard'):
+            connection = getattr(connection, 'component', None)
+        return getattr(connection, 'hcard', None)
+    
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Hold a PC/SC transaction for the duration of the block so a sequence
+        of APDUs is not interleaved or rescheduled by the resource manager.
+        Nested uses share the outermost transaction.
+        """
+        if not self.connected or self._transaction_depth:
+            self._transaction_depth += 1
+            try:
+                yield
+            finally:
+                self._transaction_depth -= 1
+            return
+        
+        hcard = self._card_handle()
+        started = False
+        if hcard is not None:
+            hresult = SCardBeginTransaction(hcard)
+            if hresult == SCARD_S_SUCCESS:
+                started = True
+            else:
+                logger.warning(f"Could not begin transaction: {SCardGetErrorMessage(hresult)}")
+        
+        self._transaction_depth += 1
+        try:
+            yield
+        finally:
+            self._transaction_depth -= 1
+            if started:
+                hresult = SCardEndTransaction(hcard, SCARD_LEAVE_CARD)
+                if hresult != SCARD_S_SUCCESS:
+                    logger.warning(f"Could not end transaction: {SCardGetErrorMessage(hresult)}")
 
 
 class SmartcardManager:
@@ -155,6 +205,8 @@ class SmartcardManager:
     def __init__(self):
         self.readers: Dict[str, SmartcardReader] = {}
         self.active_reader: Optional[SmartcardReader] = None
+        # Worker for transmit_pipelined, created on first use
+        self._pipeline_executor: Optional[ThreadPoolExecutor] = None
         
     def list_readers(self) -> List[str]:
         """List all available PC/SC readers"""
@@ -181,10 +233,23 @@ class SmartcardManager:
     
     def disconnect_all(self):
         """Disconnect from all readers"""
+        if self._pipeline_executor is not None:
+            self._pipeline_executor.shutdown()
+            self._pipeline_executor = None
         for reader in self.readers.values():
             reader.disconnect()
         self.active_reader = None
     
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group APDUs to the active reader into a single PC/SC transaction"""
+        if not self.active_reader:
+            yield
+            return
+        
+        with self.active_reader.transaction():
+            yield
+    
     def send_apdu(self, command: APDUCommand) -> APDUResponse:
         """Send APDU to the active reader"""
         if not self.active_reader:
@@ -192,6 +257,28 @@ class SmartcardManager:
         
         return self.active_reader.send_apdu(command)
     
+    def transmit_pipelined(self, first: APDUCommand, next_command: APDUCommand,
+                           more: Callable[[APDUResponse], bool]) -> Iterator[APDUResponse]:
+        """
+        Send a paginated APDU sequence, yielding each response in order
+        While the caller handles one response, the follow-up command is
+        already in flight on a worker thread. Only one APDU is outstanding
+        to the card at a time; the sequence stops when more() is false.
+        The worker is kept for later sequences until disconnect_all().
+        """
+        if self._pipeline_executor is None:
+            self._pipeline_executor = ThreadPoolExecutor(max_workers=1,
+                                                         thread_name_prefix="apdu-pipeline")
+        executor = self._pipeline_executor
+        
+        response = self.send_apdu(first)
+        while True:
+            pending = executor.submit(self.send_apdu, next_command) if more(response) else None
+            yield response
+            if pending is None:
+                return
+            response = pending.result()
+    
     def select_application(self, aid: bytes) -> APDUResponse:
         """Select an application by AID"""
         command = APDUCommand(
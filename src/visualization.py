@@ -16,6 +16,10 @@ import os
 
 logger = logging.getLogger(__name__)
 
+# Privileges are a single byte, so labels and bit rows are tabulated once
+_PRIV_LABELS = tuple(f"Priv: {i:02X}" for i in range(256))
+_PRIV_BITS = tuple(tuple(1 if i & (0x80 >> bit) else 0 for bit in range(8)) for i in range(256))
+
 
 class SecurityDomainVisualizer:
     """Creates visual representations of security domain hierarchies"""
@@ -113,8 +117,7 @@ class SecurityDomainVisualizer:
                    ha='center', va='center', fontsize=8, fontweight='bold')
             
             # Add privilege information
-            priv_text = f"Priv: {node_data['privileges']:02X}"
-            ax.text(x, y - 0.4, priv_text, 
+            ax.text(x, y - 0.4, _PRIV_LABELS[node_data['privileges']], 
                    ha='center', va='center', fontsize=6)
         
         # Draw edges (associations)
@@ -147,32 +150,20 @@ class SecurityDomainVisualizer:
         """Create a hierarchical layout for the graph"""
         pos = {}
         
-        # Find ISD (root)
-        isd_nodes = [sd for sd in security_domains if sd.domain_type == 'ISD']
-        
-        if isd_nodes:
-            isd_aid = toHexString(isd_nodes[0].aid)[-8:]
-            pos[isd_aid] = (3, 0)  # Root at top center
-        
-        # Position other security domains
-        ssd_nodes = [sd for sd in security_domains if sd.domain_type == 'SSD']
-        amsd_nodes = [sd for sd in security_domains if sd.domain_type == 'AMSD']
-        dmsd_nodes = [sd for sd in security_domains if sd.domain_type == 'DMSD']
-        
-        # Position SSDs
-        for i, sd in enumerate(ssd_nodes):
-            aid_short = toHexString(sd.aid)[-8:]
-            pos[aid_short] = (i * 2 - 1, -2)
-        
-        # Position AMSDs
-        for i, sd in enumerate(amsd_nodes):
-            aid_short = toHexString(sd.aid)[-8:]
-            pos[aid_short] = (i * 2 + 1, -3)
+        # Single pass over the domains: (x offset, y) per type, spaced 2 apart
+        placement = {'SSD': (-1, -2), 'AMSD': (1, -3), 'DMSD': (3, -2)}
+        placed = dict.fromkeys(placement, 0)
+        isd_placed = False
         
-        # Position DMSDs
-        for i, sd in enumerate(dmsd_nodes):
-            aid_short = toHexString(sd.aid)[-8:]
-            pos[aid_short] = (i * 2 + 3, -2)
+        for sd in security_domains:
+            if sd.domain_type == 'ISD':
+                if not isd_placed:  # Root at top center
+                    pos[toHexString(sd.aid)[-8:]] = (3, 0)
+                    isd_placed = True
+            elif sd.domain_type in placement:
+                x_offset, y = placement[sd.domain_type]
+                pos[toHexString(sd.aid)[-8:]] = (placed[sd.domain_type] * 2 + x_offset, y)
+                placed[sd.domain_type] += 1
         
         # Position applications
         for i, app in enumerate(applications):
@@ -272,14 +263,8 @@ class SecurityDomainVisualizer:
             return ""
         
         # Create privilege matrix
-        matrix = np.zeros((len(all_objects), 8))
-        object_names = []
-        
-        for i, (name, privileges) in enumerate(all_objects):
-            object_names.append(name)
-            for bit in range(8):
-                if privileges & (0x80 >> bit):
-                    matrix[i, bit] = 1
+        object_names = [name for name, _ in all_objects]
+        matrix = np.array([_PRIV_BITS[privileges] for _, privileges in all_objects], dtype=float)
         
         # Create heatmap
         fig, ax = plt.subplots(1, 1, figsize=(12, max(6, len(all_objects) * 0.5)))
@@ -324,21 +309,19 @@ class SecurityDomainVisualizer:
         lifecycle_names = ['OP_READY', 'INSTALLED', 'SELECTABLE', 'PERSONALIZED', 
                           'BLOCKED', 'LOCKED', 'CARD_LOCKED', 'TERMINATED']
         
-        # Count objects in each lifecycle state
-        all_objects = []
-        all_objects.extend([(sd.domain_type, sd.life_cycle.value) for sd in security_domains])
-        all_objects.extend([('Application', app.life_cycle.value) for app in applications])
-        
-        # Create data for plotting
-        types = list(set([obj[0] for obj in all_objects]))
-        data = {}
-        
-        for obj_type in types:
-            data[obj_type] = [0] * len(lifecycle_order)
-            for _, lc in all_objects:
-                if lc in lifecycle_order:
-                    idx = lifecycle_order.index(lc)
-                    data[obj_type][idx] += 1
+        # Count objects in each lifecycle state, per object type
+        lifecycles_by_type: Dict[str, List[int]] = {}
+        for sd in security_domains:
+            lifecycles_by_type.setdefault(sd.domain_type, []).append(sd.life_cycle.value)
+        if applications:
+            lifecycles_by_type['Application'] = [app.life_cycle.value for app in applications]
+        
+        # One bincount per type over the full byte range, then pick the plotted states
+        types = list(lifecycles_by_type)
+        data = {
+            obj_type: np.bincount(np.asarray(values, dtype=np.uint8), minlength=256)[lifecycle_order]
+            for obj_type, values in lifecycles_by_type.items()
+        }
         
         # Create stacked bar chart
         fig, ax = plt.subplots(1, 1, figsize=(14, 8))
@@ -368,28 +351,28 @@ class SecurityDomainVisualizer:
         return output_path
     
     def generate_all_visualizations(self, security_domains: List[SecurityDomainInfo], 
-                                  applications: List[ApplicationInfo]) -> List[str]:
-        """Generate all visualization types"""
+                                  applications: List[ApplicationInfo],
+                                  names: Optional[Dict[str, str]] = None) -> List[str]:
+        """
+        Generate all visualization types
+        names: optional output filenames keyed by 'hierarchy', 'network',
+        'privileges' or 'lifecycle'; unlisted kinds use the default name
+        """
+        names = names or {}
         output_files = []
         
-        try:
-            output_files.append(self.create_hierarchy_diagram(security_domains, applications))
-        except Exception as e:
-            logger.error(f"Error creating hierarchy diagram: {e}")
-        
-        try:
-            output_files.append(self.create_network_graph(security_domains, applications))
-        except Exception as e:
-            logger.error(f"Error creating network graph: {e}")
-        
-        try:
-            output_files.append(self.create_privilege_matrix(security_domains, applications))
-        except Exception as e:
-            logger.error(f"Error creating privilege matrix: {e}")
-        
-        try:
-            output_files.append(self.create_lifecycle_timeline(security_domains, applications))
-        except Exception as e:
-            logger.error(f"Error creating lifecycle timeline: {e}")
+        for kind, label, create in (
+            ('hierarchy', 'hierarchy diagram', self.create_hierarchy_diagram),
+            ('network', 'network graph', self.create_network_graph),
+            ('privileges', 'privilege matrix', self.create_privilege_matrix),
+            ('lifecycle', 'lifecycle timeline', self.create_lifecycle_timeline),
+        ):
+            try:
+                if kind in names:
+                    output_files.append(create(security_domains, applications, names[kind]))
+                else:
+                    output_files.append(create(security_domains, applications))
+            except Exception as e:
+                logger.error(f"Error creating {label}: {e}")
         
         return output_files
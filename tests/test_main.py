@@ -2,18 +2,19 @@
 Test suite for the Smartcard Management Tool.
 """
 
+import shutil
+import sqlite3
 import unittest
+import subprocess
 import sys
 import os
 from unittest.mock import Mock, patch, MagicMock
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from smartcard_manager import SmartcardManager, APDUCommand, APDUResponse, SmartcardException
-from globalplatform import GlobalPlatformManager, SecurityDomainInfo, ApplicationInfo, LifeCycleState
-from secure_channel import SecureChannelManager, KeySet
-from config_manager import ConfigManager
+from src.smartcard_manager import SmartcardManager, APDUCommand, APDUResponse, SmartcardException
+from src.globalplatform import GlobalPlatformManager, SecurityDomainInfo, ApplicationInfo, LifeCycleState
+from src.secure_channel import SecureChannelManager, SecureChannelSession, KeySet, _aes_cmac
+from src.config_manager import ConfigManager
+from src.database_manager import DatabaseManager, KeysetRecord, OTAMessage
 
 
 class TestAPDUCommand(unittest.TestCase):
@@ -104,10 +105,15 @@ keysets:
         
         with open(os.path.join(self.config_dir, 'keysets.yaml'), 'w') as f:
             f.write(keysets_content)
+        
+        # Keep ConfigManager off the tracked data/smartcard_tool.db
+        db_path = os.path.join(self.config_dir, 'test.db')
+        patcher = patch('src.config_manager.DatabaseManager', lambda: DatabaseManager(db_path))
+        patcher.start()
+        self.addCleanup(patcher.stop)
     
     def tearDown(self):
         """Clean up test files"""
-        import shutil
         if os.path.exists(self.config_dir):
             shutil.rmtree(self.config_dir)
     
@@ -144,6 +150,14 @@ keysets:
         }
         
         self.assertFalse(config_manager.validate_keyset(invalid_keyset))
+    
+    def test_gui_config_defaults(self):
+        """Test GUI scaling defaults when settings.yaml has no gui section"""
+        config_manager = ConfigManager(self.config_dir)
+        gui_config = config_manager.get_gui_config()
+        self.assertFalse(gui_config.automatic_dpi)
+        self.assertEqual(gui_config.widget_scaling, 1.0)
+        self.assertEqual(gui_config.window_scaling, 1.0)
 
 
 class TestSmartcardManager(unittest.TestCase):
@@ -177,6 +191,31 @@ class TestSmartcardManager(unittest.TestCase):
         
         self.assertTrue(response.is_success)
         mock_reader.send_apdu.assert_called_once()
+    
+    def test_transmit_pipelined_reuses_worker(self):
+        """Test pipelined sequences share one worker until disconnect"""
+        sc_manager = SmartcardManager()
+        
+        # Two pages: 0x6310 (more data) then 0x9000
+        mock_reader = Mock()
+        mock_reader.send_apdu.side_effect = [
+            APDUResponse([0x01, 0x63, 0x10]), APDUResponse([0x02, 0x90, 0x00]),
+            APDUResponse([0x03, 0x90, 0x00]),
+        ]
+        sc_manager.active_reader = mock_reader
+        first = APDUCommand(0x80, 0xF2, 0x80, 0x02)
+        next_command = APDUCommand(0x80, 0xF2, 0x80, 0x03)
+        more = lambda r: r.sw == 0x6310
+        
+        pages = [r.data for r in sc_manager.transmit_pipelined(first, next_command, more)]
+        executor = sc_manager._pipeline_executor
+        pages += [r.data for r in sc_manager.transmit_pipelined(first, next_command, more)]
+        
+        self.assertEqual(pages, [b'\x01', b'\x02', b'\x03'])
+        self.assertIs(sc_manager._pipeline_executor, executor)
+        
+        sc_manager.disconnect_all()
+        self.assertIsNone(sc_manager._pipeline_executor)
 
 
 class TestGlobalPlatformManager(unittest.TestCase):
@@ -224,6 +263,35 @@ class TestSecureChannelManager(unittest.TestCase):
         self.assertEqual(len(derived_key), 16)
         self.assertIsInstance(derived_key, bytes)
     
+    def test_aes_cmac_rfc4493(self):
+        """Test AES-CMAC against the RFC 4493 test vectors"""
+        key = bytes.fromhex('2b7e151628aed2a6abf7158809cf4f3c')
+        message = bytes.fromhex(
+            '6bc1bee22e409f96e93d7e117393172a'
+            'ae2d8a571e03ac9c9eb76fac45af8e51'
+            '30c81c46a35ce411e5fbc1191a0a52ef'
+            'f69f2445df4f9b17ad2b417be66c3710'
+        )
+        vectors = [
+            (0, 'bb1d6929e95937287fa37d129b756746'),
+            (16, '070a16b46b4d4144f79bdd9dd04a287c'),
+            (40, 'dfa66747de9ae63030ca32611497c827'),
+            (64, '51f0bebf7e3b9d92fc49741779363cfe'),
+        ]
+        for length, expected in vectors:
+            self.assertEqual(_aes_cmac(key, message[:length]).hex(), expected)
+    
+    def test_session_mac_matches_aes_cmac(self):
+        """Test that the session's cached CMAC context gives plain AES-CMAC results"""
+        mac_key = bytes.fromhex('2b7e151628aed2a6abf7158809cf4f3c')
+        session = SecureChannelSession(
+            protocol="SCP03", security_level=1,
+            session_keys={'mac': mac_key}, sequence_counter=0,
+            mac_chaining_value=b'\x00' * 16
+        )
+        for data in (b'', b'\x80\xf2', bytes(40)):
+            self.assertEqual(session.mac(data), _aes_cmac(mac_key, data))
+    
     def test_close_secure_channel(self):
         """Test closing secure channel"""
         # Set up a mock session
@@ -234,6 +302,78 @@ class TestSecureChannelManager(unittest.TestCase):
         self.assertIsNone(self.sc_manager.session)
 
 
+class TestDatabaseManager(unittest.TestCase):
+    """Test database manager"""
+    
+    def setUp(self):
+        """Set up a scratch database with five OTA messages"""
+        self.db_dir = os.path.join(os.path.dirname(__file__), 'test_db')
+        self.db_manager = DatabaseManager(os.path.join(self.db_dir, 'test.db'))
+        
+        self.ids = []
+        for i in range(5):
+            message = OTAMessage(None, 1, 'A000000151000000', 'LOCK', '{}',
+                                 f'{i:02X}' * 4, '', '', '')
+            message_id = self.db_manager.add_ota_message(message)
+            # Pin created_at so the newest-first order does not hinge on clock resolution
+            with sqlite3.connect(self.db_manager.db_path) as conn:
+                conn.execute("UPDATE ota_messages SET created_at = ? WHERE id = ?",
+                             (f'2024-01-01T00:00:0{i}', message_id))
+            self.ids.append(message_id)
+    
+    def tearDown(self):
+        """Clean up test files"""
+        if os.path.exists(self.db_dir):
+            shutil.rmtree(self.db_dir)
+    
+    def test_get_keyset_names(self):
+        """Test get_keyset_names returns the active keyset names of a value set, sorted"""
+        ids = {}
+        for name in ('zeta', 'alpha', 'mid'):
+            keyset = KeysetRecord(None, name, 'test_set', 'SCP03',
+                                  '40' * 16, '40' * 16, '40' * 16, 1, 3, '', '', '')
+            ids[name] = self.db_manager.add_keyset(keyset)
+        self.db_manager.delete_keyset(ids['mid'])
+        
+        self.assertEqual(self.db_manager.get_keyset_names('test_set'), ['alpha', 'zeta'])
+        self.assertEqual(self.db_manager.get_keyset_names('missing_set'), [])
+    
+    def test_get_ota_messages_limit(self):
+        """Test get_ota_messages returns the newest messages up to the limit"""
+        messages = self.db_manager.get_ota_messages(limit=3)
+        
+        self.assertEqual([m.id for m in messages], self.ids[:1:-1])
+        self.assertEqual(len(self.db_manager.get_ota_messages()), 5)
+    
+    def test_get_ota_messages_iter_chunks(self):
+        """Test get_ota_messages_iter splits the newest-first order into chunks"""
+        chunks = list(self.db_manager.get_ota_messages_iter(chunk_size=2))
+        
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertEqual([m.id for chunk in chunks for m in chunk], self.ids[::-1])
+    
+    def test_get_ota_messages_iter_limit_offset(self):
+        """Test get_ota_messages_iter pages with limit and offset"""
+        chunks = list(self.db_manager.get_ota_messages_iter(limit=3, offset=1, chunk_size=2))
+        
+        self.assertEqual([m.id for chunk in chunks for m in chunk], self.ids[3:0:-1])
+        self.assertEqual(self.db_manager.count_ota_messages(limit=3, offset=1), 3)
+        self.assertEqual(self.db_manager.count_ota_messages(limit=3, offset=4), 1)
+
+
+class TestPackageImports(unittest.TestCase):
+    """Test that the src package loads its modules on demand"""
+    
+    def test_submodule_import_skips_visualization(self):
+        """Importing one submodule must not pull in matplotlib via src/__init__"""
+        root = os.path.join(os.path.dirname(__file__), '..')
+        code = ("import sys, src.database_manager; "
+                "print('src.visualization' in sys.modules, 'matplotlib' in sys.modules)")
+        out = subprocess.run([sys.executable, '-c', code], cwd=root,
+                             capture_output=True, text=True, check=True).stdout
+        self.assertEqual(out.split(), ['False', 'False'])
+
+
 if __name__ == '__main__':
     # Create test suite
     test_loader = unittest.TestLoader()
@@ -247,6 +387,8 @@ if __name__ == '__main__':
     test_suite.addTests(test_loader.loadTestsFromTestCase(TestSmartcardManager))
     test_suite.addTests(test_loader.loadTestsFromTestCase(TestGlobalPlatformManager))
     test_suite.addTests(test_loader.loadTestsFromTestCase(TestSecureChannelManager))
+    test_suite.addTests(test_loader.loadTestsFromTestCase(TestDatabaseManager))
+    test_suite.addTests(test_loader.loadTestsFromTestCase(TestPackageImports))
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)